@@ -0,0 +1,95 @@
+"""
+Shared helpers for the installation and reproducibility benchmark scripts.
+"""
+
+import functools
+import json
+import os
+import platform
+import re
+import shlex
+import subprocess
+import time
+
+try:
+    import orjson
+except ImportError:
+    # Fall back to the stdlib encoder when orjson is not installed
+    orjson = None
+
+# A hash printed after "Environment hash:" or "🔐 Environment hash:"
+_HASH_LABEL_RE = re.compile(r'(?:🔐 )?Environment hash:[\r\n\s]*([a-f0-9]{32})')
+# Any MD5 hash in the output (32 hexadecimal characters)
+_HASH_BARE_RE = re.compile(r'\b([a-f0-9]{32})\b')
+
+
+@functools.lru_cache(maxsize=1)
+def get_system_info():
+    """Gather system information for benchmarking context (computed once; do not mutate)."""
+    return {
+        "platform": platform.system(),
+        "platform_release": platform.release(),
+        "platform_version": platform.version(),
+        "architecture": platform.machine(),
+        "processor": platform.processor(),
+        "python_version": platform.python_version(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def json_bytes(data):
+    """Serialize data as indented JSON bytes, using orjson when it is installed."""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def run_command(command, cwd=None, timeout=300, env=None):
+    """Run a command, given as an argv list without a shell, and return the output."""
+    start_time = time.time()
+    try:
+        result = subprocess.run(
+            command,
+            cwd=cwd,
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+        end_time = time.time()
+        
+        return {
+            "command": shlex.join(command),
+            "returncode": result.returncode,
+            "stdout": result.stdout,
+            "stderr": result.stderr,
+            "execution_time": end_time - start_time,
+        }
+    except subprocess.TimeoutExpired:
+        end_time = time.time()
+        print(f"Command timed out after {timeout} seconds: {shlex.join(command)}")
+        return {
+            "command": shlex.join(command),
+            "returncode": -1,
+            "stdout": "",
+            "stderr": f"Command timed out after {timeout} seconds",
+            "execution_time": end_time - start_time,
+        }
+    except OSError as e:
+        # A missing or non-executable script, which a shell would report as 127/126
+        end_time = time.time()
+        print(f"Could not run command: {shlex.join(command)}: {e}")
+        return {
+            "command": shlex.join(command),
+            "returncode": -1,
+            "stdout": "",
+            "stderr": str(e),
+            "execution_time": end_time - start_time,
+        }
+
+
+def extract_hash_from_output(stdout_text):
+    """Extract an MD5 hash from command output."""
+    # Prefer a hash following "Environment hash:", else any 32-hex-character hash
+    hash_pattern = _HASH_LABEL_RE.search(stdout_text) or _HASH_BARE_RE.search(stdout_text)
+    return hash_pattern.group(1) if hash_pattern else None
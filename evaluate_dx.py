@@ -3,12 +3,41 @@ Developer Experience (DX) evaluation script for Python dependency management too
 This script evaluates common operations and captures error messages and behaviors.
 """
 
+import asyncio
 import os
-import subprocess
 import json
+import logging
+import signal
 import tempfile
 import shutil
 from pathlib import Path
+from datetime import datetime
+
+TOOLS = ["make", "poetry", "piptools", "uv"]
+RESULTS_DIR = Path("benchmark_results")
+RAW_DIR = RESULTS_DIR / "raw"
+
+# Persistent wheel/package caches shared by every tool evaluation, so repeated
+# runs do not download the same distributions from PyPI again; created when
+# an evaluation starts
+CACHE_DIR = Path(".bench-cache").resolve()
+CACHE_ENV = {
+    "PIP_CACHE_DIR": str(CACHE_DIR / "pip"),
+    "UV_CACHE_DIR": str(CACHE_DIR / "uv"),
+    "POETRY_CACHE_DIR": str(CACHE_DIR / "poetry"),
+}
+
+# Bytes of stdout/stderr kept per command; the rest is drained and discarded so
+# memory stays bounded however verbose pip/poetry are
+OUTPUT_LIMIT = 4096
+
+# Environment setups and scenarios allowed to run at once across all tools.
+# They are bound by network and disk rather than CPU, and more parallel
+# resolves than this only slow each other into the timeout; override with
+# BENCHMARK_DX_JOBS
+MAX_CONCURRENT_JOBS = int(os.environ.get("BENCHMARK_DX_JOBS", 4))
+
+logger = logging.getLogger(__name__)
 
 # Test scenarios for developer experience evaluation
 DX_SCENARIOS = [
@@ -75,32 +104,83 @@ DX_SCENARIOS = [
 ]
 
 
-def run_command(command, cwd=None, capture_error=True):
-    """Run a shell command and return the output."""
+async def read_bounded(stream, limit=OUTPUT_LIMIT, tail=False):
+    """Read a stream to EOF, keeping only its first `limit` bytes, or its last with tail=True."""
+    kept = bytearray()
+    while chunk := await stream.read(64 * 1024):
+        if tail:
+            kept += chunk
+            del kept[:-limit]
+        elif len(kept) < limit:
+            kept += chunk[:limit - len(kept)]
+    return bytes(kept)
+
+
+def get_cached_env():
+    """Return the process environment with the package managers pointed at the shared caches."""
+    return {**os.environ, **CACHE_ENV}
+
+
+def get_venv_env(env, tool, cwd):
+    """Return env with the tool's virtual environment in cwd activated."""
+    venv_dir = os.path.join(cwd, f".venv_{tool}")
+    if not os.path.isdir(venv_dir):
+        venv_dir = os.path.join(cwd, ".venv")
+    return {
+        **env,
+        "PATH": os.path.join(venv_dir, "bin") + os.pathsep + env.get("PATH", ""),
+        "VIRTUAL_ENV": venv_dir,
+    }
+
+
+async def run_command_async(command, cwd=None, env=None, capture_error=True):
+    """Run a shell command without blocking the event loop and return the output."""
     try:
-        result = subprocess.run(
+        proc = await asyncio.create_subprocess_shell(
             command,
-            shell=True,
             cwd=cwd,
-            capture_output=True,
-            text=True,
-            timeout=180,  # 3 minutes timeout
+            env=env,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True,  # Own process group, so a timeout can kill pip/poetry grandchildren too
         )
+        io = asyncio.gather(
+            read_bounded(proc.stdout),
+            # pip, poetry and uv print the actual failure last
+            read_bounded(proc.stderr, tail=True),
+            proc.wait(),
+        )
+        try:
+            stdout, stderr, _ = await asyncio.wait_for(io, timeout=180)  # 3 minutes timeout
+        except asyncio.TimeoutError:
+            logger.warning(f"Command timed out after 180 seconds: {command}")
+            return {
+                "command": command,
+                "returncode": -1,
+                "stdout": "",
+                "stderr": "Command timed out after 180 seconds",
+                "success": False,
+            }
+        finally:
+            # Kill the process group on every early exit: a timeout, Ctrl-C or
+            # cancellation. The command runs in its own session, so the
+            # terminal's SIGINT never reaches it
+            if proc.returncode is None:
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+                await proc.wait()
+            # Mark the interrupted reads' CancelledError as seen, so asyncio
+            # does not log it as never retrieved
+            if io.done() and not io.cancelled():
+                io.exception()
         return {
             "command": command,
-            "returncode": result.returncode,
-            "stdout": result.stdout,
-            "stderr": result.stderr,
-            "success": result.returncode == 0,
-        }
-    except subprocess.TimeoutExpired:
-        print(f"Command timed out after 180 seconds: {command}")
-        return {
-            "command": command,
-            "returncode": -1,
-            "stdout": "",
-            "stderr": "Command timed out after 180 seconds",
-            "success": False,
+            "returncode": proc.returncode,
+            "stdout": stdout.decode(errors="replace"),
+            "stderr": stderr.decode(errors="replace"),
+            "success": proc.returncode == 0,
         }
     except Exception as e:
         if capture_error:
@@ -115,7 +195,15 @@ def run_command(command, cwd=None, capture_error=True):
             raise
 
 
-def prepare_environment(tool, tmp_dir):
+def link_or_copy(src, dst):
+    """Hardlink src to dst, falling back to a copy across filesystems."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy(src, dst)
+
+
+async def prepare_environment(tool, tmp_dir):
     """Prepare the environment for a tool."""
     # Copy necessary files
     for file in ["pyproject.toml", "requirements.in", "requirements.txt", "Makefile", "README.md"]:
@@ -147,66 +235,151 @@ def prepare_environment(tool, tmp_dir):
             "success": False,
         }
     
-    # Copy installation script
+    # Link the installation script; it is never modified, unlike the project
+    # files above which scenarios append to and rewrite in place
     dest_script_path = os.path.join(tmp_dir, "scripts", f"install_{tool}.sh")
-    shutil.copy(script_path, dest_script_path)
+    link_or_copy(script_path, dest_script_path)
     os.chmod(dest_script_path, 0o755)  # Make executable
     
     # Run installation
-    return run_command(f"./scripts/install_{tool}.sh", cwd=tmp_dir)
+    return await run_command_async(f"./scripts/install_{tool}.sh", cwd=tmp_dir, env=get_cached_env())
+
+
+async def run_one_scenario(tool, scenario, cwd):
+    """Run a single DX scenario for a tool inside its own working directory."""
+    logger.info(f"[{tool}] Running scenario: {scenario['name']}")
+    
+    # Get the command for this tool
+    command = scenario["commands"][tool]
+    
+    # Activate the virtual environment if needed, by putting its bin directory
+    # first on PATH rather than sourcing the activate script in a shell
+    env = get_cached_env()
+    if "pip-compile" in command or "pip install" in command:
+        if tool != "poetry":  # Poetry handles its own venv activation
+            env = get_venv_env(env, tool, cwd)
+    
+    # Run the command
+    result = await run_command_async(command, cwd=cwd, env=env)
+    
+    scenario_result = {
+        "name": scenario["name"],
+        "description": scenario["description"],
+        "command": command,
+        "success": result["success"],
+        "returncode": result["returncode"],
+        "error": result["stderr"] if not result["success"] else None,
+        "output": result["stdout"][:500] + "..." if len(result["stdout"]) > 500 else result["stdout"],
+    }
+    
+    logger.info(f"[{tool}] {scenario['name']}: {'✅ Success' if result['success'] else '❌ Failed'}")
+    return scenario_result
+
 
+async def run_limited(slots, coro):
+    """Await coro once one of the semaphore's slots is free."""
+    # Wait before starting, so command timeouts only count while the job runs
+    async with slots:
+        return await coro
 
-def evaluate_tool_dx(tool):
+
+async def evaluate_tool_dx(tool, slots):
     """Evaluate the developer experience of a tool."""
     results = {
         "tool": tool,
         "scenarios": []
     }
     
-    print(f"\n=== Evaluating DX for {tool} ===")
+    logger.info(f"[{tool}] === Evaluating DX ===")
     
-    # Create a temporary directory for this tool
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        # Prepare environment
-        setup_result = prepare_environment(tool, tmp_dir)
+    # Create a temporary directory for this tool; it is removed in a worker
+    # thread, since deleting several venvs would otherwise stall the event loop
+    # and with it every other tool's pipe readers and timeouts
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        scenarios = []
+        for scenario in DX_SCENARIOS:
+            if not scenario["commands"].get(tool):
+                logger.warning(f"[{tool}] ⚠️ No command defined in scenario {scenario['name']}")
+                continue
+            scenarios.append(scenario)
+        
+        # Prepare a separate environment for each scenario so the scenarios can
+        # run concurrently without touching each other's files or packages. A
+        # prepared directory cannot simply be copied: the scripts in a venv's
+        # bin/ point at the venv they were created in, so a copy would still
+        # install into the original.
+        scen_dirs = [os.path.join(tmp_dir, f"scenario_{index}") for index in range(len(scenarios))]
+        for scen_dir in scen_dirs:
+            os.makedirs(scen_dir)
+        setup_results = await asyncio.gather(
+            *[run_limited(slots, prepare_environment(tool, scen_dir)) for scen_dir in scen_dirs]
+        )
         
-        if not setup_result["success"]:
-            print(f"  ❌ Failed to set up environment for {tool}")
-            print(f"  Error: {setup_result['stderr']}")
+        setup_result = next((r for r in setup_results if not r["success"]), None)
+        if setup_result:
+            logger.error(f"[{tool}] ❌ Failed to set up environment")
+            logger.error(f"[{tool}] Error: {setup_result['stderr']}")
             results["setup_error"] = setup_result["stderr"]
             return results
         
-        # Run each scenario
-        for scenario in DX_SCENARIOS:
-            print(f"  Running scenario: {scenario['name']}")
-            
-            # Get the command for this tool
-            command = scenario["commands"].get(tool)
-            if not command:
-                print(f"  ⚠️ No command defined for {tool} in scenario {scenario['name']}")
-                continue
-            
-            # Activate the virtual environment if needed
-            if "pip-compile" in command or "pip install" in command:
-                if tool != "poetry":  # Poetry handles its own venv activation
-                    command = f"source .venv/bin/activate && {command}"
-            
-            # Run the command
-            result = run_command(command, cwd=tmp_dir)
-            
-            # Add result to the list
-            scenario_result = {
-                "name": scenario["name"],
-                "description": scenario["description"],
-                "command": command,
-                "success": result["success"],
-                "returncode": result["returncode"],
-                "error": result["stderr"] if not result["success"] else None,
-                "output": result["stdout"][:500] + "..." if len(result["stdout"]) > 500 else result["stdout"],
-            }
-            
-            results["scenarios"].append(scenario_result)
-            
-            print(f"    {'✅ Success' if result['success'] else '❌ Failed'}")
+        # gather() keeps the scenario order of DX_SCENARIOS
+        results["scenarios"] = list(await asyncio.gather(
+            *[
+                run_limited(slots, run_one_scenario(tool, scenario, scen_dir))
+                for scenario, scen_dir in zip(scenarios, scen_dirs)
+            ]
+        ))
+    finally:
+        await asyncio.to_thread(shutil.rmtree, tmp_dir, ignore_errors=True)
+    
+    return results
+
+
+async def evaluate_all_tools(tools):
+    """Evaluate every tool concurrently on a single event loop."""
+    for cache_path in CACHE_ENV.values():
+        os.makedirs(cache_path, exist_ok=True)
     
-    return results
\ No newline at end of file
+    # Created here rather than at import, as a semaphore stays bound to the
+    # first event loop that waits on it
+    slots = asyncio.Semaphore(MAX_CONCURRENT_JOBS)
+    tool_results = await asyncio.gather(*[evaluate_tool_dx(tool, slots) for tool in tools])
+    return dict(zip(tools, tool_results))
+
+
+def configure_logging():
+    """Configure logging so interleaved output from concurrent evaluations stays readable."""
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s", datefmt="%H:%M:%S")
+
+
+def main():
+    configure_logging()
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    
+    # Each tool is evaluated in its own temporary directory, so the evaluations
+    # are independent and dominated by subprocess I/O; run them concurrently.
+    results = asyncio.run(evaluate_all_tools(TOOLS))
+    
+    # Save results to a JSON file with timestamp
+    RAW_DIR.mkdir(parents=True, exist_ok=True)
+    results_file = RAW_DIR / f"dx_evaluation_results_{timestamp}.json"
+    with open(results_file, "w") as f:
+        json.dump(results, f, indent=2)
+    
+    # Also save to the standard location for backward compatibility
+    with open("dx_evaluation_results.json", "w") as f:
+        json.dump(results, f, indent=2)
+    
+    # Print summary
+    print("\n=== Developer Experience Summary ===")
+    for tool, result in results.items():
+        scenarios = result.get("scenarios", [])
+        passed = sum(1 for s in scenarios if s["success"])
+        print(f"{tool}: {passed}/{len(scenarios)} scenarios succeeded")
+    
+    print(f"\nResults saved to: {results_file}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -2,42 +2,170 @@
 Generate a comprehensive Markdown report from benchmark results.
 """
 
+import functools
+import hashlib
+import heapq
+import io
 import json
 import os
 import glob
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import platform
-import pandas as pd
-import matplotlib.pyplot as plt
+import shutil
 import numpy as np
 import argparse
 from pathlib import Path
 
-# Create results directory if it doesn't exist
+try:
+    import orjson
+except ImportError:
+    # Fall back to the stdlib decoder when orjson is not installed
+    orjson = None
+
+# Results directories, created on demand when a report is generated
 RESULTS_DIR = Path("benchmark_results")
-RESULTS_DIR.mkdir(exist_ok=True)
 RAW_DIR = RESULTS_DIR / "raw"
-RAW_DIR.mkdir(exist_ok=True)
+
+# Resolution of the detailed hyperfine and unified score charts, which used to
+# be saved at 300 DPI; the other charts keep the figure's default of 100.
+# Override with BENCHMARK_CHART_DPI for print-quality output.
+CHART_DPI = int(os.environ.get("BENCHMARK_CHART_DPI", 150))
+
+# Rendered PNGs, keyed by a hash of the plotted data, reused across reports
+CHART_CACHE_DIR = RESULTS_DIR / "chart_cache"
+
+# Chart labels are plain text, so skip mathtext parsing and favour speed over
+# hinting and path fidelity; applied when the first figure is created
+_RC_PARAMS = {
+    "text.parse_math": False,
+    "text.hinting": "none",
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+}
+
+# Bar and series colours shared by every chart
+_PALETTE = ('#3498db', '#2ecc71', '#e74c3c', '#f39c12')
+
+# Figures reused across charts, keyed by figure size; created on first use
+_FIGURES = {}
+
+
+def _make_canvas(figsize=(10, 6), nrows=1, ncols=1, **subplots_kw):
+    """Return a cleared (fig, ax) of the given size, drawn with Agg outside pyplot."""
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    
+    fig = _FIGURES.get(figsize)
+    if fig is None:
+        if not _FIGURES:
+            import matplotlib
+            matplotlib.rcParams.update(_RC_PARAMS)
+        fig = _FIGURES[figsize] = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+    fig.clear()
+    ax = fig.subplots(nrows, ncols, **subplots_kw)
+    return fig, ax
+
+
+@functools.lru_cache(maxsize=1)
+def _palette_rgba():
+    """Return _PALETTE as an RGBA array, converted once per process."""
+    from matplotlib.colors import to_rgba_array
+    return to_rgba_array(_PALETTE)
+
+
+@functools.lru_cache(maxsize=None)
+def _font(size="medium"):
+    """Return a shared FontProperties of the given size for chart titles and labels."""
+    from matplotlib.font_manager import FontProperties
+    return FontProperties(size=size)
+
+
+@functools.lru_cache(maxsize=1)
+def _source_digest():
+    """Hash this module so cached charts are invalidated when the drawing code changes."""
+    return hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).hexdigest()
+
+
+def _chart_cache_path(name, *data):
+    """Return the cache path for a chart drawn from the given data."""
+    key = [name, CHART_DPI, _source_digest(), data]
+    payload = orjson.dumps(key) if orjson else json.dumps(key).encode()
+    return CHART_CACHE_DIR / f"{hashlib.blake2b(payload, digest_size=16).hexdigest()}.png"
+
+
+def _link_or_copy(src, dst):
+    """Hardlink src to dst, copying when links are not supported."""
+    try:
+        os.link(src, dst)
+    except FileExistsError:
+        pass
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def _reuse_chart(cache_path, output_file):
+    """Link a previously rendered chart into place; return False if none is cached."""
+    if not cache_path.exists():
+        return False
+    _link_or_copy(cache_path, output_file)
+    return True
+
+
+def _save_chart(fig, output_file, cache_path=None, dpi="figure"):
+    """Write a chart as PNG, cropping to content in the same pass with fast zlib compression."""
+    # Encode into memory so the file is written in one call rather than in libpng-sized chunks
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=dpi, bbox_inches="tight", pil_kwargs={"compress_level": 1})
+    Path(output_file).write_bytes(buf.getbuffer())
+    if cache_path is not None:
+        CHART_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _link_or_copy(output_file, cache_path)
+
+
+def parse_json(path):
+    """Parse a JSON file read through a 64 KiB buffered reader."""
+    with open(path, "rb", buffering=64 * 1024) as f:
+        data = f.read()
+    return orjson.loads(data) if orjson else json.loads(data)
 
 
 def load_json_file(filename):
     """Load a JSON file if it exists, otherwise return None."""
-    if os.path.exists(filename):
-        with open(filename, "r") as f:
-            return json.load(f)
+    return parse_json(filename) if os.path.exists(filename) else None
+
+
+def locate_latest(prefix):
+    """Return the path of the latest JSON file with the given prefix, or None."""
+    # Filenames end in a sortable timestamp, so the latest is the largest name
+    latest = max(glob.iglob(str(RAW_DIR / f"{prefix}_*.json")), default=None)
+    if latest:
+        return latest
+    # Check for legacy files
+    if os.path.exists(f"{prefix}.json"):
+        return f"{prefix}.json"
     return None
 
 
 def load_latest_json(prefix):
-    """Load the latest JSON file with the given prefix."""
-    files = sorted(glob.glob(str(RAW_DIR / f"{prefix}_*.json")), reverse=True)
-    if not files:
-        # Check for legacy files
-        if os.path.exists(f"{prefix}.json"):
-            return load_json_file(f"{prefix}.json"), f"{prefix}.json"
+    """Load the latest JSON file with the given prefix, returning (data, path)."""
+    path = locate_latest(prefix)
+    if path is None:
         return None, None
-    with open(files[0], "r") as f:
-        return json.load(f), os.path.basename(files[0])
+    return parse_json(path), path
+
+
+def source_name(path):
+    """Describe a data source in the report header."""
+    return os.path.basename(path) if path else "N/A"
+
+
+@functools.lru_cache(maxsize=1)
+def _system_info():
+    """Return the platform details shown in the report header."""
+    return (platform.system(), platform.release(), platform.machine(), platform.python_version())
 
 
 def generate_installation_speed_chart(data, output_file):
@@ -53,32 +181,26 @@ def generate_installation_speed_chart(data, output_file):
         times.append(result.get("execution_time", 0))
     
     # Sort by time (ascending)
-    sorted_indices = np.argsort(times)
-    sorted_tools = [tools[i] for i in sorted_indices]
-    sorted_times = [times[i] for i in sorted_indices]
+    pairs = sorted(zip(tools, times), key=lambda p: p[1])
+    sorted_tools, sorted_times = map(list, zip(*pairs)) if pairs else ([], [])
+    
+    cache_path = _chart_cache_path("installation", sorted_tools, sorted_times)
+    if _reuse_chart(cache_path, output_file):
+        return sorted_tools, sorted_times
     
     # Create bar chart
-    plt.figure(figsize=(10, 6))
-    bars = plt.bar(sorted_tools, sorted_times, color=['#3498db', '#2ecc71', '#e74c3c', '#f39c12'])
+    fig, ax = _make_canvas()
+    bars = ax.bar(sorted_tools, sorted_times, color=_palette_rgba())
     
-    plt.title("Installation Speed Comparison")
-    plt.xlabel("Tool")
-    plt.ylabel("Time (seconds)")
-    plt.grid(axis='y', linestyle='--', alpha=0.7)
+    ax.set_title("Installation Speed Comparison", fontproperties=_font("large"))
+    ax.set_xlabel("Tool", fontproperties=_font())
+    ax.set_ylabel("Time (seconds)", fontproperties=_font())
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
     
     # Add time labels on top of bars
-    for bar, time in zip(bars, sorted_times):
-        plt.text(
-            bar.get_x() + bar.get_width()/2,
-            bar.get_height() + 0.1,
-            f"{time:.2f}s",
-            ha='center',
-            fontweight='bold'
-        )
+    ax.bar_label(bars, labels=[f"{time:.2f}s" for time in sorted_times], padding=3, fontweight='bold')
     
-    plt.tight_layout()
-    plt.savefig(output_file)
-    plt.close()
+    _save_chart(fig, output_file, cache_path)
     
     return sorted_tools, sorted_times
 
@@ -95,19 +217,21 @@ def generate_reproducibility_chart(data, output_file):
         tools.append(tool)
         reproducible.append(1 if result.get("reproducible", False) else 0)
     
+    cache_path = _chart_cache_path("reproducibility", tools, reproducible)
+    if _reuse_chart(cache_path, output_file):
+        return tools, reproducible
+    
     # Create bar chart
-    plt.figure(figsize=(10, 6))
-    bars = plt.bar(tools, reproducible, color=['#3498db', '#2ecc71', '#e74c3c', '#f39c12'])
+    fig, ax = _make_canvas()
+    bars = ax.bar(tools, reproducible, color=_palette_rgba())
     
-    plt.title("Environment Reproducibility")
-    plt.xlabel("Tool")
-    plt.ylabel("Reproducible")
-    plt.yticks([0, 1], ["No", "Yes"])
-    plt.grid(axis='y', linestyle='--', alpha=0.7)
+    ax.set_title("Environment Reproducibility", fontproperties=_font("large"))
+    ax.set_xlabel("Tool", fontproperties=_font())
+    ax.set_ylabel("Reproducible", fontproperties=_font())
+    ax.set_yticks([0, 1], ["No", "Yes"])
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
     
-    plt.tight_layout()
-    plt.savefig(output_file)
-    plt.close()
+    _save_chart(fig, output_file, cache_path)
     
     return tools, reproducible
 
@@ -117,6 +241,8 @@ def generate_hash_comparison_chart(data, output_file):
     if not data:
         return None
     
+    from matplotlib.colors import ListedColormap
+    
     tools = []
     hash_consistency = []
     hash_samples = []
@@ -130,181 +256,167 @@ def generate_hash_comparison_chart(data, output_file):
         is_consistent = len(set(h for h in hashes if h is not None)) <= 1 and None not in hashes
         hash_consistency.append(1 if is_consistent else 0)
     
+    cache_path = _chart_cache_path("hash_comparison", tools, hash_consistency, hash_samples)
+    if _reuse_chart(cache_path, output_file):
+        return tools, hash_consistency, hash_samples
+    
     # Create a figure with two subplots
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10), gridspec_kw={'height_ratios': [1, 3]})
+    fig, (ax1, ax2) = _make_canvas((12, 10), 2, 1, gridspec_kw={'height_ratios': [1, 3]})
     
     # First subplot: bar chart of consistency
     bars = ax1.bar(tools, hash_consistency, color=['green' if c == 1 else 'red' for c in hash_consistency])
-    ax1.set_title('Environment Hash Consistency', fontsize=14)
-    ax1.set_ylabel('Consistent')
+    ax1.set_title('Environment Hash Consistency', fontproperties=_font(14))
+    ax1.set_ylabel('Consistent', fontproperties=_font())
     ax1.set_ylim(0, 1.2)
     ax1.set_yticks([0, 1])
     ax1.set_yticklabels(['No', 'Yes'])
     
     # Add labels on top of bars
-    for bar, consistency in zip(bars, hash_consistency):
-        label = "✓ Consistent" if consistency == 1 else "✗ Different"
-        color = "green" if consistency == 1 else "red"
-        ax1.text(
-            bar.get_x() + bar.get_width()/2,
-            bar.get_height() + 0.05,
-            label,
-            ha='center',
-            color=color,
-            fontweight='bold'
-        )
-    
-    # Second subplot: hash value comparison
-    for i, (tool, hashes) in enumerate(zip(tools, hash_samples)):
-        # Create a heatmap-like representation of hash values
+    labels = ["✓ Consistent" if consistency == 1 else "✗ Different" for consistency in hash_consistency]
+    for text, consistency in zip(ax1.bar_label(bars, labels=labels, padding=3, fontweight='bold'), hash_consistency):
+        text.set_color("green" if consistency == 1 else "red")
+    
+    # Second subplot: hash value comparison, drawn as one heatmap image.
+    # Cell values: 1 consistent, 0 inconsistent, -1 missing hash, NaN no run.
+    num_runs = max((len(hashes) for hashes in hash_samples), default=0)
+    grid = np.full((num_runs, len(tools)), np.nan)
+    for i, hashes in enumerate(hash_samples):
         for j, hash_value in enumerate(hashes):
-            if hash_value is None:
-                color = 'gray'
-                hash_short = "None"
-            else:
-                color = 'green' if hash_consistency[i] == 1 else 'red'
-                # Display just the first 8 chars of the hash for readability
-                hash_short = hash_value[:8] + "..." if hash_value else "None"
-            
-            ax2.text(i, j, hash_short, ha='center', va='center', 
-                     bbox=dict(facecolor=color, alpha=0.3, boxstyle='round,pad=0.5'))
+            grid[j, i] = -1 if hash_value is None else hash_consistency[i]
+            # Display just the first 8 chars of the hash for readability
+            hash_short = hash_value[:8] + "..." if hash_value else "None"
+            ax2.text(i, j, hash_short, ha='center', va='center')
     
-    ax2.set_title('Hash Values Across Runs', fontsize=14)
+    ax2.imshow(grid, aspect='auto', cmap=ListedColormap(['gray', 'red', 'green']), vmin=-1, vmax=1, alpha=0.3)
+    ax2.set_title('Hash Values Across Runs', fontproperties=_font(14))
     ax2.set_xticks(range(len(tools)))
     ax2.set_xticklabels(tools)
-    ax2.set_yticks(range(len(hash_samples[0])))
-    ax2.set_yticklabels([f"Run {i+1}" for i in range(len(hash_samples[0]))])
+    ax2.set_yticks(range(num_runs))
+    ax2.set_yticklabels([f"Run {i+1}" for i in range(num_runs)])
     ax2.set_xlim(-0.5, len(tools) - 0.5)
-    ax2.set_ylim(-0.5, len(hash_samples[0]) - 0.5)
+    ax2.set_ylim(-0.5, num_runs - 0.5)
     ax2.grid(True, linestyle='--', alpha=0.7)
     
-    plt.tight_layout()
-    plt.savefig(output_file)
-    plt.close()
+    _save_chart(fig, output_file, cache_path)
     
     return tools, hash_consistency, hash_samples
 
 
+def _summarize_dx(dx_results):
+    """Aggregate DX results per tool in a single pass over the scenarios."""
+    summary = {}
+    for tool, result in dx_results.items():
+        scenarios = result.get("scenarios", [])
+        successes = np.fromiter((bool(s.get("success")) for s in scenarios), dtype=np.bool_, count=len(scenarios))
+        summary[tool] = {
+            "scenarios": scenarios,
+            "pass_count": int(successes.sum()),
+            "success_rate": float(successes.mean() * 100) if scenarios else 0.0,
+        }
+    return summary
+
+
 def generate_dx_chart(data, output_file):
-    """Generate a chart for developer experience results."""
+    """Generate a chart for developer experience results from a _summarize_dx summary."""
     if not data:
         return None
     
     tools = []
     success_rates = []
     
-    for tool, result in data.items():
-        scenarios = result.get("scenarios", [])
-        if not scenarios:
+    for tool, summary in data.items():
+        if not summary["scenarios"]:
             continue
         
         tools.append(tool)
-        success_count = sum(1 for s in scenarios if s.get("success", False))
-        success_rate = success_count / len(scenarios) * 100
-        success_rates.append(success_rate)
+        success_rates.append(summary["success_rate"])
+    
+    cache_path = _chart_cache_path("dx", tools, success_rates)
+    if _reuse_chart(cache_path, output_file):
+        return tools, success_rates
     
     # Create bar chart
-    plt.figure(figsize=(10, 6))
-    bars = plt.bar(tools, success_rates, color=['#3498db', '#2ecc71', '#e74c3c', '#f39c12'])
+    fig, ax = _make_canvas()
+    bars = ax.bar(tools, success_rates, color=_palette_rgba())
     
-    plt.title("Developer Experience - Scenario Success Rate")
-    plt.xlabel("Tool")
-    plt.ylabel("Success Rate (%)")
-    plt.ylim(0, 100)
-    plt.grid(axis='y', linestyle='--', alpha=0.7)
+    ax.set_title("Developer Experience - Scenario Success Rate", fontproperties=_font("large"))
+    ax.set_xlabel("Tool", fontproperties=_font())
+    ax.set_ylabel("Success Rate (%)", fontproperties=_font())
+    ax.set_ylim(0, 100)
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
     
     # Add percentage labels on top of bars
-    for bar, rate in zip(bars, success_rates):
-        plt.text(
-            bar.get_x() + bar.get_width()/2,
-            bar.get_height() + 1,
-            f"{rate:.1f}%",
-            ha='center',
-            fontweight='bold'
-        )
+    ax.bar_label(bars, labels=[f"{rate:.1f}%" for rate in success_rates], padding=3, fontweight='bold')
     
-    plt.tight_layout()
-    plt.savefig(output_file)
-    plt.close()
+    _save_chart(fig, output_file, cache_path)
     
     return tools, success_rates
 
 
+def _hyperfine_tool(result):
+    """Extract the tool name from a hyperfine result's command."""
+    command_name = result.get("command", "").split("&&")[-1].strip()
+    return command_name.split("/")[-2] if "/" in command_name else command_name
+
+
 def generate_hyperfine_chart(data, output_file):
     """Generate a chart for hyperfine benchmark results."""
     if not data:
         return None
     
-    # Extract data from hyperfine results
-    commands = []
-    mean_times = []
-    std_devs = []
-    min_times = []
-    max_times = []
-    
-    for result in data.get("results", []):
-        command_name = result.get("command", "").split("&&")[-1].strip()
-        # Extract tool name from command
-        tool = command_name.split("/")[-2] if "/" in command_name else command_name
-        commands.append(tool)
-        
-        mean = result.get("mean", 0)
-        stddev = result.get("stddev", 0)
-        min_time = result.get("min", 0)
-        max_time = result.get("max", 0)
-        
-        mean_times.append(mean)
-        std_devs.append(stddev)
-        min_times.append(min_time)
-        max_times.append(max_time)
+    # Extract data from hyperfine results into one structured array
+    results = data.get("results", [])
+    rows = np.fromiter(
+        (
+            (_hyperfine_tool(result), result.get("mean", 0), result.get("stddev", 0), result.get("min", 0), result.get("max", 0))
+            for result in results
+        ),
+        dtype=[("tool", object), ("mean", float), ("stddev", float), ("min", float), ("max", float)],
+        count=len(results),
+    )
     
     # Sort by mean time (ascending)
-    if commands:
-        sorted_indices = np.argsort(mean_times)
-        commands = [commands[i] for i in sorted_indices]
-        mean_times = [mean_times[i] for i in sorted_indices]
-        std_devs = [std_devs[i] for i in sorted_indices]
-        min_times = [min_times[i] for i in sorted_indices]
-        max_times = [max_times[i] for i in sorted_indices]
+    rows.sort(order="mean", kind="stable")
+    columns = (
+        rows["tool"].tolist(),
+        rows["mean"].tolist(),
+        rows["stddev"].tolist(),
+        rows["min"].tolist(),
+        rows["max"].tolist(),
+    )
+    
+    cache_path = _chart_cache_path("hyperfine", *columns)
+    if _reuse_chart(cache_path, output_file):
+        return columns
     
     # Create bar chart with error bars
-    plt.figure(figsize=(12, 8))
-    x = range(len(commands))
+    fig, ax = _make_canvas((12, 8))
+    x = np.arange(len(rows))
     
     # Main bars for mean times
-    bars = plt.bar(x, mean_times, yerr=std_devs, capsize=10, 
-                  color=['#3498db', '#2ecc71', '#e74c3c', '#f39c12'],
+    bars = ax.bar(x, rows["mean"], yerr=rows["stddev"], capsize=10, 
+                  color=_palette_rgba(),
                   alpha=0.7, ecolor='black')
     
-    # Add a thin line for min-max range
-    for i, (min_t, max_t) in enumerate(zip(min_times, max_times)):
-        plt.plot([i, i], [min_t, max_t], 'k-', linewidth=1.5)
-        plt.plot([i-0.1, i+0.1], [min_t, min_t], 'k-', linewidth=1.5)
-        plt.plot([i-0.1, i+0.1], [max_t, max_t], 'k-', linewidth=1.5)
+    # Add a thin line for min-max range, with caps at both ends
+    ax.vlines(x, rows["min"], rows["max"], colors='k', linewidth=1.5)
+    ax.hlines(rows["min"], x - 0.1, x + 0.1, colors='k', linewidth=1.5)
+    ax.hlines(rows["max"], x - 0.1, x + 0.1, colors='k', linewidth=1.5)
     
     # Chart styling
-    plt.title("Hyperfine Benchmark: Installation Speed", fontsize=16)
-    plt.xlabel("Tool", fontsize=14)
-    plt.ylabel("Time (seconds)", fontsize=14)
-    plt.xticks(x, commands, fontsize=12)
-    plt.grid(axis='y', linestyle='--', alpha=0.7)
+    ax.set_title("Hyperfine Benchmark: Installation Speed", fontproperties=_font(16))
+    ax.set_xlabel("Tool", fontproperties=_font(14))
+    ax.set_ylabel("Time (seconds)", fontproperties=_font(14))
+    ax.set_xticks(x, rows["tool"], fontsize=12)
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
     
-    # Add time labels on top of bars
-    for bar, time, std in zip(bars, mean_times, std_devs):
-        plt.text(
-            bar.get_x() + bar.get_width()/2,
-            bar.get_height() + std + 0.1,
-            f"{time:.2f}s ±{std:.2f}",
-            ha='center',
-            fontweight='bold',
-            fontsize=10
-        )
+    # Add time labels above the error bars
+    labels = [f"{time:.2f}s ±{std:.2f}" for time, std in zip(rows["mean"], rows["stddev"])]
+    ax.bar_label(bars, labels=labels, padding=3, fontweight='bold', fontsize=10)
     
-    plt.tight_layout()
-    plt.savefig(output_file, dpi=300)
-    plt.close()
+    _save_chart(fig, output_file, cache_path, dpi=CHART_DPI)
     
-    return commands, mean_times, std_devs, min_times, max_times
+    return columns
 
 
 def generate_unified_score_chart(installation_data, hyperfine_data, reproducibility_data, dx_data, output_file):
@@ -327,46 +439,44 @@ def generate_unified_score_chart(installation_data, hyperfine_data, reproducibil
     if dx_data and len(dx_data) >= 2:
         all_tools.update(dx_data[0])
     
-    # Calculate hyperfine times if available (more accurate)
-    hyperfine_times = {}
+    # Index each metric by tool so lookups below are O(1)
+    install_map = dict(zip(installation_data[0], installation_data[1]))
+    repro_map = dict(zip(reproducibility_data[0], reproducibility_data[1]))
+    dx_map = dict(zip(dx_data[0], dx_data[1]))
+    
+    # Prefer hyperfine times if available (more accurate)
     if hyperfine_data:
-        tools_hyper, times_hyper = hyperfine_data[0], hyperfine_data[1]
-        hyperfine_times = dict(zip(tools_hyper, times_hyper))
+        install_map.update(zip(hyperfine_data[0], hyperfine_data[1]))
     
     # Create consistent tools list
     tools = sorted(all_tools)
     
     # Gather metrics for each tool
     for tool in tools:
-        # Installation time
-        if hyperfine_times and tool in hyperfine_times:
-            # Prefer hyperfine for more accurate benchmarks
-            time = hyperfine_times[tool]
-        elif tool in installation_data[0]:
-            idx = installation_data[0].index(tool)
-            time = installation_data[1][idx]
-        else:
-            time = None
-        install_times.append(time)
-        
-        # Reproducibility score
-        if tool in reproducibility_data[0]:
-            idx = reproducibility_data[0].index(tool)
-            repro = reproducibility_data[1][idx] * 100  # Convert to percentage
-        else:
-            repro = None
-        repro_scores.append(repro)
-        
-        # Developer experience score
-        if tool in dx_data[0]:
-            idx = dx_data[0].index(tool)
-            dx = dx_data[1][idx]
-        else:
-            dx = None
-        dx_scores.append(dx)
+        install_times.append(install_map.get(tool))
+        repro = repro_map.get(tool)
+        repro_scores.append(repro * 100 if repro is not None else None)  # Convert to percentage
+        dx_scores.append(dx_map.get(tool))
+    
+    # Normalize speed scores (inverse since lower is better): the fastest tool
+    # scores 100, the slowest 0, and tools without a time score 0
+    times = np.array([np.nan if t is None else t for t in install_times], dtype=np.float64)
+    speed_scores = np.zeros(len(tools))
+    valid = ~np.isnan(times)
+    if valid.any():
+        min_time = np.nanmin(times)
+        span = np.nanmax(times) - min_time
+        speed_scores[valid] = 100 * (1 - (times[valid] - min_time) / span) if span else 100.0
+    repro_values = np.array([r or 0 for r in repro_scores], dtype=np.float64)
+    dx_values = np.array([d or 0 for d in dx_scores], dtype=np.float64)
+    
+    # Calculate unified scores (weighted average)
+    # Weight: speed (40%), reproducibility (40%), DX (20%)
+    unified_scores = 0.4 * speed_scores + 0.4 * repro_values + 0.2 * dx_values
     
-    # Create a radar chart
-    plt.figure(figsize=(12, 10))
+    cache_path = _chart_cache_path("unified", tools, speed_scores.tolist(), repro_values.tolist(), dx_values.tolist())
+    if _reuse_chart(cache_path, output_file):
+        return tools, unified_scores, speed_scores, repro_scores, dx_scores
     
     # Set up the radar chart
     categories = ['Installation Speed', 'Reproducibility', 'Developer Experience']
@@ -376,36 +486,22 @@ def generate_unified_score_chart(installation_data, hyperfine_data, reproducibil
     angles = np.linspace(0, 2*np.pi, num_vars, endpoint=False).tolist()
     angles += angles[:1]  # Close the loop
     
-    # Set up the subplot
-    ax = plt.subplot(111, polar=True)
+    # Create a radar chart on a polar subplot
+    fig, ax = _make_canvas((12, 10), subplot_kw={'polar': True})
     
     # Draw one axis per variable and add labels
-    plt.xticks(angles[:-1], categories, size=12)
+    ax.set_xticks(angles[:-1], categories, size=12)
     
     # Set y-ticks
     ax.set_rlabel_position(0)
-    plt.yticks([25, 50, 75, 100], ["25", "50", "75", "100"], color="grey", size=10)
-    plt.ylim(0, 100)
-    
-    # Normalize speed scores (inverse since lower is better)
-    # Get the max time, and calculate score as percentage of max (inverted)
-    valid_times = [t for t in install_times if t is not None]
-    if valid_times:
-        max_time = max(valid_times)
-        min_time = min(valid_times)
-        speed_scores = [100 * (1 - ((t - min_time) / (max_time - min_time))) if t is not None else 0 for t in install_times]
-    else:
-        speed_scores = [0] * len(tools)
+    ax.set_yticks([25, 50, 75, 100], ["25", "50", "75", "100"], color="grey", size=10)
+    ax.set_ylim(0, 100)
     
     # Plot each tool
-    colors = ['#3498db', '#2ecc71', '#e74c3c', '#f39c12']
+    colors = _palette_rgba()
     for i, tool in enumerate(tools):
         # Prepare data for this tool
-        values = [
-            speed_scores[i] if i < len(speed_scores) else 0,
-            repro_scores[i] if i < len(repro_scores) and repro_scores[i] is not None else 0,
-            dx_scores[i] if i < len(dx_scores) and dx_scores[i] is not None else 0
-        ]
+        values = [speed_scores[i], repro_values[i], dx_values[i]]
         values += values[:1]  # Close the loop
         
         # Plot the tool's values
@@ -413,107 +509,121 @@ def generate_unified_score_chart(installation_data, hyperfine_data, reproducibil
         ax.fill(angles, values, color=colors[i % len(colors)], alpha=0.1)
     
     # Add legend
-    plt.legend(loc='upper right', bbox_to_anchor=(0.1, 0.1))
-    
-    plt.title("Unified Tool Performance Comparison", size=16, y=1.1)
-    plt.tight_layout()
-    plt.savefig(output_file, dpi=300)
-    plt.close()
+    ax.legend(loc='upper right', bbox_to_anchor=(0.1, 0.1))
     
-    # Calculate unified scores (weighted average)
-    unified_scores = []
-    for i, tool in enumerate(tools):
-        speed = speed_scores[i] if i < len(speed_scores) else 0
-        repro = repro_scores[i] if i < len(repro_scores) and repro_scores[i] is not None else 0
-        dx = dx_scores[i] if i < len(dx_scores) and dx_scores[i] is not None else 0
-        
-        # Weight: speed (40%), reproducibility (40%), DX (20%)
-        score = (speed * 0.4) + (repro * 0.4) + (dx * 0.2)
-        unified_scores.append(score)
+    ax.set_title("Unified Tool Performance Comparison", fontproperties=_font(16), y=1.1)
+    _save_chart(fig, output_file, cache_path, dpi=CHART_DPI)
     
     return tools, unified_scores, speed_scores, repro_scores, dx_scores
 
 
-def format_dx_results_table(dx_results):
-    """Format DX results as a Markdown table."""
-    if not dx_results:
-        return ""
-    
-    table = "| Tool | Scenario | Description | Success |\n"
-    table += "|------|----------|-------------|--------|\n"
+def _render_chart(chart_func, data, output_file):
+    """Worker entry point for the chart pool: render one chart and return its data."""
+    return chart_func(data, output_file)
+
+
+def format_dx_results_table(dx_summary, f):
+    """Write DX results from a _summarize_dx summary to f as a Markdown table."""
+    if not dx_summary:
+        return
     
-    for tool, result in dx_results.items():
-        scenarios = result.get("scenarios", [])
-        for i, scenario in enumerate(scenarios):
-            tool_cell = tool if i == 0 else ""
-            success_icon = "✅" if scenario.get("success", False) else "❌"
-            
-            table += f"| {tool_cell} | {scenario.get('name', '')} | {scenario.get('description', '')} | {success_icon} |\n"
+    f.write("| Tool | Scenario | Description | Success |\n")
+    f.write("|------|----------|-------------|--------|\n")
     
-    return table
+    # Only the first row of each tool's block shows the tool name
+    rows = [
+        (tool if i == 0 else "", scenario.get("name", ""), scenario.get("description", ""), "✅" if scenario.get("success", False) else "❌")
+        for tool, summary in dx_summary.items()
+        for i, scenario in enumerate(summary["scenarios"])
+    ]
+    # Fields come straight from the JSON and may be missing (None) or non-strings
+    f.writelines(f"| {' | '.join(str(v) if v is not None else '' for v in row)} |\n" for row in rows)
 
 
 def generate_markdown_report(args=None):
     """Generate a Markdown report from benchmark results."""
     # Generate a timestamp for the report
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    now = datetime.now()
+    timestamp = now.strftime('%Y%m%d_%H%M%S')
+    system, release, machine, python_version = _system_info()
     
-    # Create timestamped results directory
+    # Create timestamped results directory (and RESULTS_DIR with it)
     report_dir = RESULTS_DIR / f"report_{timestamp}"
-    report_dir.mkdir(exist_ok=True)
+    report_dir.mkdir(parents=True, exist_ok=True)
     
     # Load benchmark results
-    installation_results, install_file = load_latest_json("installation_benchmark_results")
-    reproducibility_results, repro_file = load_latest_json("reproducibility_results") 
-    dx_results, dx_file = load_latest_json("dx_evaluation_results")
-    hyperfine_results, hyperfine_file = load_latest_json("hyperfine-results")
-    
-    # Save copies of the raw data with timestamps
+    installation_results, install_path = load_latest_json("installation_benchmark_results")
+    reproducibility_results, repro_path = load_latest_json("reproducibility_results")
+    dx_results, dx_path = load_latest_json("dx_evaluation_results")
+    hyperfine_results, hyperfine_path = load_latest_json("hyperfine-results")
+    
+    # Save copies of the raw data with timestamps. The source files are already
+    # JSON, so copy their bytes instead of re-encoding the parsed data.
+    archives = [
+        (installation_results, install_path, "installation_benchmark_results", "installation"),
+        (reproducibility_results, repro_path, "reproducibility_results", "reproducibility"),
+        (dx_results, dx_path, "dx_evaluation_results", "developer experience"),
+        (hyperfine_results, hyperfine_path, "hyperfine_results", "hyperfine"),
+    ]
+    # A sidecar records each archived source as [path, mtime_ns, archive path],
+    # so inputs unchanged since the last report are not archived again
+    mtimes_path = RAW_DIR / ".last_mtimes.json"
+    try:
+        last_mtimes = parse_json(mtimes_path)
+    except (OSError, ValueError):
+        last_mtimes = {}
+    copies = []
+    for results, src_path, archive_prefix, label in archives:
+        if not results:
+            continue
+        source = [str(src_path), os.stat(src_path).st_mtime_ns]
+        previous = last_mtimes.get(archive_prefix)
+        if previous and (previous[:2] == source or previous[2] == source[0]) and os.path.exists(previous[2]):
+            print(f"Unchanged {label} results already saved to {previous[2]}")
+            continue
+        output_path = RAW_DIR / f"{archive_prefix}_{timestamp}.json"
+        copies.append((src_path, output_path, label))
+        last_mtimes[archive_prefix] = source + [str(output_path)]
+    if copies:
+        RAW_DIR.mkdir(exist_ok=True)
+    # The copies are independent and I/O-bound, so overlap them on threads
+    with ThreadPoolExecutor(max_workers=len(archives)) as executor:
+        saved = executor.map(lambda copy: shutil.copyfile(copy[0], copy[1]), copies)
+        for output_path, (_, _, label) in zip(saved, copies):
+            print(f"Saved {label} results to {output_path}")
+    if copies:
+        with open(mtimes_path, "w") as f:
+            json.dump(last_mtimes, f, indent=2)
+    
+    # Generate charts. They are independent CPU-bound renders, so draw them in
+    # parallel worker processes and collect the data each chart returns.
+    chart_jobs = {}
     if installation_results:
-        output_path = RAW_DIR / f"installation_benchmark_results_{timestamp}.json"
-        with open(output_path, "w") as f:
-            json.dump(installation_results, f, indent=2)
-        print(f"Saved installation results to {output_path}")
+        chart_jobs["installation"] = (generate_installation_speed_chart, installation_results, report_dir / "installation_speed.png")
     
     if reproducibility_results:
-        output_path = RAW_DIR / f"reproducibility_results_{timestamp}.json" 
-        with open(output_path, "w") as f:
-            json.dump(reproducibility_results, f, indent=2)
-        print(f"Saved reproducibility results to {output_path}")
+        chart_jobs["reproducibility"] = (generate_reproducibility_chart, reproducibility_results, report_dir / "reproducibility.png")
+        chart_jobs["hash_comparison"] = (generate_hash_comparison_chart, reproducibility_results, report_dir / "hash_comparison.png")
     
-    if dx_results:
-        output_path = RAW_DIR / f"dx_evaluation_results_{timestamp}.json"
-        with open(output_path, "w") as f:
-            json.dump(dx_results, f, indent=2)
-        print(f"Saved developer experience results to {output_path}")
+    dx_summary = _summarize_dx(dx_results) if dx_results else None
+    if dx_summary:
+        chart_jobs["dx"] = (generate_dx_chart, dx_summary, report_dir / "dx_success_rate.png")
     
     if hyperfine_results:
-        output_path = RAW_DIR / f"hyperfine_results_{timestamp}.json"
-        with open(output_path, "w") as f:
-            json.dump(hyperfine_results, f, indent=2)
-        print(f"Saved hyperfine results to {output_path}")
-    
-    # Generate charts
-    installation_data = None
-    reproducibility_data = None
-    hash_comparison_data = None
-    dx_data = None
-    hyperfine_data = None
+        chart_jobs["hyperfine"] = (generate_hyperfine_chart, hyperfine_results, report_dir / "hyperfine_benchmark.png")
+    
+    chart_outputs = {}
+    if chart_jobs:
+        with multiprocessing.Pool(len(chart_jobs)) as pool:
+            chart_outputs = dict(zip(chart_jobs, pool.starmap(_render_chart, chart_jobs.values())))
+    
+    installation_data = chart_outputs.get("installation")
+    reproducibility_data = chart_outputs.get("reproducibility")
+    hash_comparison_data = chart_outputs.get("hash_comparison")
+    dx_data = chart_outputs.get("dx")
+    hyperfine_data = chart_outputs.get("hyperfine")
     unified_score_data = None
     
-    if installation_results:
-        installation_data = generate_installation_speed_chart(installation_results, report_dir / "installation_speed.png")
-    
-    if reproducibility_results:
-        reproducibility_data = generate_reproducibility_chart(reproducibility_results, report_dir / "reproducibility.png")
-        hash_comparison_data = generate_hash_comparison_chart(reproducibility_results, report_dir / "hash_comparison.png")
-    
-    if dx_results:
-        dx_data = generate_dx_chart(dx_results, report_dir / "dx_success_rate.png")
-    
-    if hyperfine_results:
-        hyperfine_data = generate_hyperfine_chart(hyperfine_results, report_dir / "hyperfine_benchmark.png")
-    
     # Generate unified scoring chart if we have at least two metrics
     if sum(x is not None for x in [installation_data, reproducibility_data, dx_data]) >= 2:
         unified_score_data = generate_unified_score_chart(
@@ -524,20 +634,22 @@ def generate_markdown_report(args=None):
             report_dir / "unified_score.png"
         )
     
-    # Generate Markdown report
-    report_md = f"""# Python Dependency Management Benchmark Results
+    # Stream the Markdown report straight to disk
+    report_path = report_dir / "report.md"
+    with open(report_path, "w", encoding="utf-8", buffering=64 * 1024) as f:
+        f.write(f"""# Python Dependency Management Benchmark Results
 
-*Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*
+*Generated on {now.strftime('%Y-%m-%d %H:%M:%S')}*
 
 **System Information:**
-- OS: {platform.system()} {platform.release()} ({platform.machine()})
-- Python: {platform.python_version()}
+- OS: {system} {release} ({machine})
+- Python: {python_version}
 
 ## Data Sources
-- Installation: {install_file or "N/A"}
-- Reproducibility: {repro_file or "N/A"}
-- Developer Experience: {dx_file or "N/A"}
-- Hyperfine Benchmarks: {hyperfine_file or "N/A"}
+- Installation: {source_name(install_path)}
+- Reproducibility: {source_name(repro_path)}
+- Developer Experience: {source_name(dx_path)}
+- Hyperfine Benchmarks: {source_name(hyperfine_path)}
 
 ## Executive Summary
 
@@ -552,60 +664,63 @@ The evaluation covers three key aspects:
 2. **Reproducibility**: Consistency of environments across multiple runs
 3. **Developer Experience**: Success rate in common development workflows
 
-"""
+""")
 
-    # Add installation speed results
-    report_md += """## Installation Speed
+        # Add installation speed results
+        f.write("""## Installation Speed
 
 The chart below shows the time taken by each tool to install the same set of dependencies.
 
 ![Installation Speed Comparison](installation_speed.png)
 
-"""
+""")
     
-    if installation_data:
-        tools, times = installation_data
-        report_md += "| Tool | Installation Time |\n"
-        report_md += "|------|------------------|\n"
-        for tool, time in zip(tools, times):
-            report_md += f"| {tool} | {time:.2f}s |\n"
+        if installation_data:
+            tools, times = installation_data
+            f.write("| Tool | Installation Time |\n")
+            f.write("|------|------------------|\n")
+            f.writelines(f"| {tool} | {time:.2f}s |\n" for tool, time in zip(tools, times))
         
-        report_md += f"\n**Fastest Tool**: {tools[0]} ({times[0]:.2f}s)\n"
-        report_md += f"**Slowest Tool**: {tools[-1]} ({times[-1]:.2f}s)\n"
-        report_md += f"**Speed Difference**: {times[-1]/times[0]:.1f}x\n"
+            f.write(f"\n**Fastest Tool**: {tools[0]} ({times[0]:.2f}s)\n")
+            f.write(f"**Slowest Tool**: {tools[-1]} ({times[-1]:.2f}s)\n")
+            f.write(f"**Speed Difference**: {times[-1]/times[0]:.1f}x\n")
     
-    # Add hyperfine benchmark results
-    report_md += """
+        # Add hyperfine benchmark results
+        f.write("""
 ## Hyperfine Benchmark Results
 
 Hyperfine provides high-resolution benchmarks with multiple runs for more accurate measurements.
 
 ![Hyperfine Benchmark Results](hyperfine_benchmark.png)
 
-"""
+""")
     
-    if hyperfine_data:
-        tools, mean_times, std_devs, min_times, max_times = hyperfine_data
-        report_md += "| Tool | Mean Time | Std Dev | Min Time | Max Time |\n"
-        report_md += "|------|-----------|---------|----------|----------|\n"
-        for tool, mean, std, min_t, max_t in zip(tools, mean_times, std_devs, min_times, max_times):
-            report_md += f"| {tool} | {mean:.2f}s | ±{std:.2f}s | {min_t:.2f}s | {max_t:.2f}s |\n"
+        if hyperfine_data:
+            tools, mean_times, std_devs, min_times, max_times = hyperfine_data
+            f.write("| Tool | Mean Time | Std Dev | Min Time | Max Time |\n")
+            f.write("|------|-----------|---------|----------|----------|\n")
+            f.writelines(
+                f"| {tool} | {mean:.2f}s | ±{std:.2f}s | {min_t:.2f}s | {max_t:.2f}s |\n"
+                for tool, mean, std, min_t, max_t in zip(tools, mean_times, std_devs, min_times, max_times)
+            )
         
-        fastest_idx = np.argmin(mean_times)
-        slowest_idx = np.argmax(mean_times)
+            fastest_idx = np.argmin(mean_times)
+            slowest_idx = np.argmax(mean_times)
         
-        report_md += f"\n**Fastest Tool**: {tools[fastest_idx]} ({mean_times[fastest_idx]:.2f}s)\n"
-        report_md += f"**Slowest Tool**: {tools[slowest_idx]} ({mean_times[slowest_idx]:.2f}s)\n"
-        report_md += f"**Speed Difference**: {mean_times[slowest_idx]/mean_times[fastest_idx]:.1f}x\n"
+            f.write(f"\n**Fastest Tool**: {tools[fastest_idx]} ({mean_times[fastest_idx]:.2f}s)\n")
+            f.write(f"**Slowest Tool**: {tools[slowest_idx]} ({mean_times[slowest_idx]:.2f}s)\n")
+            f.write(f"**Speed Difference**: {mean_times[slowest_idx]/mean_times[fastest_idx]:.1f}x\n")
         
-        # Calculate coefficient of variation (CV) for each tool
-        report_md += "\n**Consistency (lower CV is better)**:\n"
-        for tool, mean, std in zip(tools, mean_times, std_devs):
-            cv = (std / mean) * 100  # Coefficient of variation as percentage
-            report_md += f"- {tool}: {cv:.2f}% variability\n"
-    
-    # Add reproducibility results
-    report_md += """
+            # Calculate coefficient of variation (CV) for each tool
+            f.write("\n**Consistency (lower CV is better)**:\n")
+            # Coefficient of variation as percentage
+            f.writelines(
+                f"- {tool}: {(std / mean) * 100:.2f}% variability\n"
+                for tool, mean, std in zip(tools, mean_times, std_devs)
+            )
+    
+        # Add reproducibility results
+        f.write("""
 ## Reproducibility
 
 This section evaluates whether each tool produces consistent environments across multiple runs.
@@ -618,118 +733,117 @@ The chart below shows a detailed comparison of environment hashes across multipl
 
 ![Hash Comparison](hash_comparison.png)
 
-"""
+""")
     
-    if reproducibility_data:
-        tools, reproducible = reproducibility_data
-        report_md += "| Tool | Reproducible |\n"
-        report_md += "|------|-------------|\n"
-        for tool, rep in zip(tools, reproducible):
-            report_md += f"| {tool} | {'Yes' if rep == 1 else 'No'} |\n"
+        if reproducibility_data:
+            tools, reproducible = reproducibility_data
+            f.write("| Tool | Reproducible |\n")
+            f.write("|------|-------------|\n")
+            f.writelines(f"| {tool} | {'Yes' if rep == 1 else 'No'} |\n" for tool, rep in zip(tools, reproducible))
         
-        reproducible_tools = [tools[i] for i, rep in enumerate(reproducible) if rep == 1]
-        non_reproducible_tools = [tools[i] for i, rep in enumerate(reproducible) if rep == 0]
+            reproducible_tools = [tools[i] for i, rep in enumerate(reproducible) if rep == 1]
+            non_reproducible_tools = [tools[i] for i, rep in enumerate(reproducible) if rep == 0]
         
-        if reproducible_tools:
-            report_md += f"\n**Reproducible Tools**: {', '.join(reproducible_tools)}\n"
-        if non_reproducible_tools:
-            report_md += f"**Non-Reproducible Tools**: {', '.join(non_reproducible_tools)}\n"
+            if reproducible_tools:
+                f.write(f"\n**Reproducible Tools**: {', '.join(reproducible_tools)}\n")
+            if non_reproducible_tools:
+                f.write(f"**Non-Reproducible Tools**: {', '.join(non_reproducible_tools)}\n")
             
-        # Add hash details if available
-        if hash_comparison_data:
-            report_md += "\n### Hash Details\n\n"
-            hash_tools, _, hash_samples = hash_comparison_data
+            # Add hash details if available
+            if hash_comparison_data:
+                f.write("\n### Hash Details\n\n")
+                hash_tools, _, hash_samples = hash_comparison_data
             
-            for i, tool in enumerate(hash_tools):
-                report_md += f"**{tool}**:\n"
-                for j, hash_value in enumerate(hash_samples[i]):
-                    hash_display = hash_value if hash_value else "None"
-                    report_md += f"- Run {j+1}: `{hash_display}`\n"
-                report_md += "\n"
-    
-    # Add developer experience results
-    report_md += """
+                for i, tool in enumerate(hash_tools):
+                    f.write(f"**{tool}**:\n")
+                    f.writelines(
+                        f"- Run {j+1}: `{hash_value or 'None'}`\n"
+                        for j, hash_value in enumerate(hash_samples[i])
+                    )
+                    f.write("\n")
+    
+        # Add developer experience results
+        f.write("""
 ## Developer Experience
 
 This section evaluates how well each tool handles common developer workflows.
 
 ![Developer Experience - Scenario Success Rate](dx_success_rate.png)
 
-"""
+""")
     
-    if dx_data:
-        tools, success_rates = dx_data
-        report_md += "| Tool | Success Rate |\n"
-        report_md += "|------|-------------|\n"
-        for tool, rate in zip(tools, success_rates):
-            report_md += f"| {tool} | {rate:.1f}% |\n"
+        if dx_data:
+            tools, success_rates = dx_data
+            f.write("| Tool | Success Rate |\n")
+            f.write("|------|-------------|\n")
+            f.writelines(f"| {tool} | {rate:.1f}% |\n" for tool, rate in zip(tools, success_rates))
         
-        best_tool_idx = np.argmax(success_rates)
-        worst_tool_idx = np.argmin(success_rates)
+            best_tool_idx = np.argmax(success_rates)
+            worst_tool_idx = np.argmin(success_rates)
         
-        report_md += f"\n**Best DX Tool**: {tools[best_tool_idx]} ({success_rates[best_tool_idx]:.1f}%)\n"
-        report_md += f"**Worst DX Tool**: {tools[worst_tool_idx]} ({success_rates[worst_tool_idx]:.1f}%)\n"
+            f.write(f"\n**Best DX Tool**: {tools[best_tool_idx]} ({success_rates[best_tool_idx]:.1f}%)\n")
+            f.write(f"**Worst DX Tool**: {tools[worst_tool_idx]} ({success_rates[worst_tool_idx]:.1f}%)\n")
     
-    # Add detailed DX results
-    report_md += """
+        # Add detailed DX results
+        f.write("""
 ### Detailed Developer Experience Results
 
 The table below shows the success/failure of each tool in specific development scenarios.
 
-"""
+""")
     
-    if dx_results:
-        report_md += format_dx_results_table(dx_results)
+        if dx_summary:
+            format_dx_results_table(dx_summary, f)
     
-    # Add performance analysis section
-    report_md += """
+        # Add performance analysis section
+        f.write("""
 ## Performance Analysis
 
 ### Speed Comparison
 
 The following chart shows the relative performance of each tool compared to the fastest one.
 
-"""
+""")
     
-    # Add performance comparison based on hyperfine results
-    if hyperfine_data:
-        tools, mean_times, std_devs, min_times, max_times = hyperfine_data
+        # Add performance comparison based on hyperfine results
+        if hyperfine_data:
+            tools, mean_times, std_devs, min_times, max_times = hyperfine_data
         
-        # Find the fastest tool
-        fastest_idx = np.argmin(mean_times)
-        fastest_time = mean_times[fastest_idx]
-        fastest_tool = tools[fastest_idx]
+            # Find the fastest tool
+            fastest_idx = np.argmin(mean_times)
+            fastest_time = mean_times[fastest_idx]
+            fastest_tool = tools[fastest_idx]
         
-        # Calculate relative speeds
-        relative_speeds = [time / fastest_time for time in mean_times]
+            # Calculate relative speeds
+            relative_speeds = [time / fastest_time for time in mean_times]
         
-        # Create a comparison table
-        report_md += "| Tool | Time | Relative Speed |\n"
-        report_md += "|------|------|---------------|\n"
+            # Create a comparison table
+            f.write("| Tool | Time | Relative Speed |\n")
+            f.write("|------|------|---------------|\n")
         
-        for i, tool in enumerate(tools):
-            is_fastest = (i == fastest_idx)
-            speed_text = "1.0x (fastest)" if is_fastest else f"{relative_speeds[i]:.1f}x slower"
-            report_md += f"| {tool} | {mean_times[i]:.2f}s | {speed_text} |\n"
+            for i, tool in enumerate(tools):
+                is_fastest = (i == fastest_idx)
+                speed_text = "1.0x (fastest)" if is_fastest else f"{relative_speeds[i]:.1f}x slower"
+                f.write(f"| {tool} | {mean_times[i]:.2f}s | {speed_text} |\n")
         
-        # Add uv vs pip-tools comparison if both exist
-        if 'uv' in tools and 'piptools' in tools:
-            uv_idx = tools.index('uv')
-            piptools_idx = tools.index('piptools')
-            speedup = mean_times[piptools_idx] / mean_times[uv_idx]
+            # Add uv vs pip-tools comparison if both exist
+            if 'uv' in tools and 'piptools' in tools:
+                uv_idx = tools.index('uv')
+                piptools_idx = tools.index('piptools')
+                speedup = mean_times[piptools_idx] / mean_times[uv_idx]
             
-            report_md += f"\n**UV vs pip-tools**: uv is {speedup:.1f}x faster than pip-tools\n"
+                f.write(f"\n**UV vs pip-tools**: uv is {speedup:.1f}x faster than pip-tools\n")
             
-        # Add uv vs poetry comparison if both exist
-        if 'uv' in tools and 'poetry' in tools:
-            uv_idx = tools.index('uv')
-            poetry_idx = tools.index('poetry')
-            speedup = mean_times[poetry_idx] / mean_times[uv_idx]
+            # Add uv vs poetry comparison if both exist
+            if 'uv' in tools and 'poetry' in tools:
+                uv_idx = tools.index('uv')
+                poetry_idx = tools.index('poetry')
+                speedup = mean_times[poetry_idx] / mean_times[uv_idx]
             
-            report_md += f"**UV vs poetry**: uv is {speedup:.1f}x faster than poetry\n"
+                f.write(f"**UV vs poetry**: uv is {speedup:.1f}x faster than poetry\n")
     
-    # Add comprehensive qualitative analysis
-    report_md += """
+        # Add comprehensive qualitative analysis
+        f.write("""
 ### Qualitative Analysis
 
 | Tool | Strengths | Weaknesses |
@@ -738,81 +852,89 @@ The following chart shows the relative performance of each tool compared to the
 | poetry | • Comprehensive dependency management<br>• Built-in packaging<br>• Virtual environment handling | • Slower installation times<br>• Issues with reproducibility in our tests |
 | pip-tools | • Simple workflow<br>• Direct use of pip<br>• Reproducible environments | • Significantly slower installation<br>• Requires additional steps for venv management |
 | make | • Flexible, script-based approach<br>• Works with standard tools<br>• Reproducible environments | • Requires more manual setup<br>• Slower installation times |
-"""
+""")
     
-    # Add conclusion
-    report_md += """
+        # Add conclusion
+        f.write("""
 ## Conclusion
 
 Based on the benchmark results, here's a summary of the strengths and weaknesses of each tool:
 
-"""
+""")
     
-    # Add the unified score section if available
-    if unified_score_data:
-        tools, unified_scores, speed_scores, repro_scores, dx_scores = unified_score_data
+        # Add the unified score section if available
+        if unified_score_data:
+            tools, unified_scores, speed_scores, repro_scores, dx_scores = unified_score_data
         
-        report_md += """
+            f.write("""
 ### Unified Performance Score
 
 The chart below combines all metrics (installation speed, reproducibility, and developer experience) into a unified score:
 
 ![Unified Performance Score](unified_score.png)
 
-"""
+""")
+        
+            f.write("| Tool | Unified Score | Speed Score | Reproducibility | DX Score |\n")
+            f.write("|------|--------------|-------------|-----------------|----------|\n")
         
-        report_md += "| Tool | Unified Score | Speed Score | Reproducibility | DX Score |\n"
-        report_md += "|------|--------------|-------------|-----------------|----------|\n"
+            # Sort tools by unified score (descending)
+            sorted_indices = np.argsort(unified_scores)[::-1]
         
-        # Sort tools by unified score (descending)
-        sorted_indices = np.argsort(unified_scores)[::-1]
+            for idx in sorted_indices:
+                tool = tools[idx]
+                f.write(f"| {tool} | {unified_scores[idx]:.1f}% | {speed_scores[idx]:.1f}% | {repro_scores[idx]:.1f}% | {dx_scores[idx]:.1f}% |\n")
         
-        for idx in sorted_indices:
-            tool = tools[idx]
-            report_md += f"| {tool} | {unified_scores[idx]:.1f}% | {speed_scores[idx]:.1f}% | {repro_scores[idx]:.1f}% | {dx_scores[idx]:.1f}% |\n"
+            f.write("\n**Scoring Weights**: Installation Speed (40%), Reproducibility (40%), Developer Experience (20%)\n\n")
         
-        report_md += "\n**Scoring Weights**: Installation Speed (40%), Reproducibility (40%), Developer Experience (20%)\n\n"
+            # Add the best tool based on unified score
+            best_idx = np.argmax(unified_scores)
+            f.write(f"**Best Overall Tool**: {tools[best_idx]} with a score of {unified_scores[best_idx]:.1f}%\n\n")
+    
+        # Generate conclusion if we have all data
+        if installation_data and reproducibility_data and dx_data:
+            tools_speed = installation_data[0]
+            tools_repro = reproducibility_data[0]
+            repro_status = reproducibility_data[1]
+            tools_dx = dx_data[0]
+            dx_rates = dx_data[1]
         
-        # Add the best tool based on unified score
-        best_idx = np.argmax(unified_scores)
-        report_md += f"**Best Overall Tool**: {tools[best_idx]} with a score of {unified_scores[best_idx]:.1f}%\n\n"
-    
-    # Generate conclusion if we have all data
-    if installation_data and reproducibility_data and dx_data:
-        tools_speed = installation_data[0]
-        tools_repro = reproducibility_data[0]
-        repro_status = reproducibility_data[1]
-        tools_dx = dx_data[0]
-        dx_rates = dx_data[1]
+            # Precompute lookups so the per-tool loop does no sorting or list scans
+            speed_idx = {t: i for i, t in enumerate(tools_speed)}
+            repro_of = dict(zip(tools_repro, repro_status))
+            dx_idx = {t: i for i, t in enumerate(tools_dx)}
+            dx_order = np.argsort(-np.asarray(dx_rates), kind="stable")
+            dx_rank_of = {tools_dx[i]: rank for rank, i in enumerate(dx_order, 1)}
         
-        # Create tool summary
-        for tool in set(tools_speed + tools_repro + tools_dx):
-            report_md += f"### {tool}\n\n"
+            # Create tool summary, in a stable order from run to run
+            tool_order = sorted({*tools_speed, *tools_repro, *tools_dx})
+            for tool in tool_order:
+                f.write(f"### {tool}\n\n")
             
-            # Speed ranking
-            if tool in tools_speed:
-                speed_rank = tools_speed.index(tool) + 1
-                speed_time = installation_data[1][tools_speed.index(tool)]
-                speed_text = f"**Installation Speed**: {speed_rank}/{len(tools_speed)} ({speed_time:.2f}s)"
-                report_md += f"- {speed_text}\n"
+                # Speed ranking
+                if tool in speed_idx:
+                    speed_rank = speed_idx[tool] + 1
+                    speed_time = installation_data[1][speed_idx[tool]]
+                    speed_text = f"**Installation Speed**: {speed_rank}/{len(tools_speed)} ({speed_time:.2f}s)"
+                    f.write(f"- {speed_text}\n")
             
-            # Reproducibility
-            if tool in tools_repro:
-                is_repro = repro_status[tools_repro.index(tool)] == 1
-                repro_text = f"**Reproducibility**: {'✅ Yes' if is_repro else '❌ No'}"
-                report_md += f"- {repro_text}\n"
+                # Reproducibility
+                if tool in repro_of:
+                    is_repro = repro_of[tool] == 1
+                    repro_text = f"**Reproducibility**: {'✅ Yes' if is_repro else '❌ No'}"
+                    f.write(f"- {repro_text}\n")
             
-            # DX
-            if tool in tools_dx:
-                dx_rate = dx_rates[tools_dx.index(tool)]
-                dx_rank = sorted(range(len(dx_rates)), key=lambda i: dx_rates[i], reverse=True).index(tools_dx.index(tool)) + 1
-                dx_text = f"**Developer Experience**: {dx_rank}/{len(tools_dx)} ({dx_rate:.1f}%)"
-                report_md += f"- {dx_text}\n"
+                # DX
+                if tool in dx_idx:
+                    dx_rate = dx_rates[dx_idx[tool]]
+                    dx_rank = dx_rank_of[tool]
+                    dx_text = f"**Developer Experience**: {dx_rank}/{len(tools_dx)} ({dx_rate:.1f}%)"
+                    f.write(f"- {dx_text}\n")
             
-            report_md += "\n"
+                f.write("\n")
     
-    # Add recommendations with specific use cases
-    report_md += """
+        # Add recommendations with specific use cases
+        f.write("""
 ## Recommendations
 
 Based on the benchmark results, here are specific recommendations for different use cases:
@@ -852,17 +974,13 @@ If you're currently using requirements.txt files directly:
 **uv** shows the most promising results in our benchmarks, with exceptional speed and good reproducibility. While it's a newer tool that may continue to evolve, its performance advantages are substantial enough to consider adoption, particularly in environments where installation speed matters.
 
 However, all tools tested have their merits and choosing the right one depends on your specific requirements around speed, reproducibility, and developer experience.
-"""
+""")
 
-    # Write Markdown report to file
-    report_path = report_dir / "report.md"
-    with open(report_path, "w") as f:
-        f.write(report_md)
-    
-    # Also save a copy of the latest report in the main results directory
+    # Also expose the latest report in the main results directory, as a
+    # hardlink to the report rather than a second copy of its bytes
     latest_report_path = RESULTS_DIR / "latest_report.md"
-    with open(latest_report_path, "w") as f:
-        f.write(report_md)
+    latest_report_path.unlink(missing_ok=True)
+    _link_or_copy(report_path, latest_report_path)
     
     print(f"Markdown report generated at {report_path}")
     print(f"Latest report available at {latest_report_path}")
@@ -877,13 +995,23 @@ def main():
     args = parser.parse_args()
     
     if args.clean:
-        # Keep only the latest 5 reports
-        reports = sorted(glob.glob(str(RESULTS_DIR / "report_*")))
+        # Keep only the latest 5 reports; names end in a sortable timestamp
+        reports = []
+        if RESULTS_DIR.is_dir():
+            with os.scandir(RESULTS_DIR) as entries:
+                reports = [entry for entry in entries if entry.name.startswith("report_") and entry.is_dir()]
         if len(reports) > 5:
-            for old_report in reports[:-5]:
-                shutil.rmtree(old_report)
-                print(f"Removed old report: {old_report}")
-    
+            for old_report in heapq.nsmallest(len(reports) - 5, reports, key=lambda entry: entry.name):
+                shutil.rmtree(old_report.path)
+                print(f"Removed old report: {old_report.path}")
+        
+        # Drop cached charts that no remaining report links to
+        if CHART_CACHE_DIR.is_dir():
+            with os.scandir(CHART_CACHE_DIR) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.stat().st_nlink == 1:
+                        os.unlink(entry.path)
+
     if not args.json_only:
         timestamp = generate_markdown_report(args)
         print(f"Report generated with timestamp: {timestamp}")
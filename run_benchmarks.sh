@@ -91,7 +91,7 @@ source $REPORT_VENV/bin/activate
 # Install Python dependencies for reporting
 echo "Installing dependencies for reporting tools"
 pip install --upgrade pip
-pip install pandas matplotlib pytest pytest-benchmark
+pip install matplotlib orjson pytest pytest-benchmark
 
 # Run the benchmarks
 print_header "Running installation benchmarks"
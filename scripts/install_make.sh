@@ -15,8 +15,30 @@ if ! command -v make &> /dev/null; then
     fi
 fi
 
+# Where to create the environment; callers may point this outside the project
+VENV_DIR="${BENCH_VENV_DIR:-.venv_make}"
+
+# The old environment is deleted below, so only accept a path inside the
+# project or the temporary directory that does not contain the project
+VENV_PATH=$(mkdir -p "$(dirname "$VENV_DIR")" && cd "$(dirname "$VENV_DIR")" && pwd -P)/$(basename "$VENV_DIR")
+TMP_ROOT=$(cd "${TMPDIR:-/tmp}" && pwd -P)
+case "$(basename "$VENV_DIR")" in
+    .|..|/) VENV_PATH="/" ;;
+esac
+case "$VENV_PATH" in
+    "$(pwd -P)"/*|"$TMP_ROOT"/*) ;;
+    *) VENV_PATH="/" ;;
+esac
+case "$(pwd -P)/" in
+    "$VENV_PATH"/*) VENV_PATH="/" ;;
+esac
+if [ "$VENV_PATH" = "/" ]; then
+    echo "Error: refusing to replace $VENV_DIR: it must be inside $(pwd -P) or $TMP_ROOT and must not contain the project"
+    exit 1
+fi
+
 echo "Cleaning old environment..."
-rm -rf .venv_make
+rm -rf "$VENV_DIR"
 
 # Ensure requirements.txt exists
 if [ ! -f requirements.txt ]; then
@@ -65,7 +87,7 @@ echo "Installing dependencies..."
 START=$(date +%s.%N)
 
 # Run make install using our benchmark-specific Makefile
-make -f Makefile.benchmark install
+make -f Makefile.benchmark install VENV_DIR="$VENV_DIR"
 
 END=$(date +%s.%N)
 DIFF=$(echo "$END - $START" | bc)
@@ -73,13 +95,13 @@ echo "✅ Make installation completed in $DIFF seconds"
 
 # Show installed packages
 echo "📦 Installed packages:"
-.venv_make/bin/pip freeze | sort
+"$VENV_DIR/bin/pip" freeze | sort
 
 # Output environment hash for reproducibility check
 echo "🔐 Environment hash:"
 if command -v md5sum &> /dev/null; then
-    .venv_make/bin/pip freeze | sort | md5sum
+    "$VENV_DIR/bin/pip" freeze | sort | md5sum
 else
     # For macOS which uses md5 instead of md5sum
-    .venv_make/bin/pip freeze | sort | md5
+    "$VENV_DIR/bin/pip" freeze | sort | md5
 fi
\ No newline at end of file
@@ -4,12 +4,34 @@ SCRIPT_DIR=$(dirname "$(realpath "$0")")
 PROJECT_ROOT=$(dirname "$SCRIPT_DIR")
 cd "$PROJECT_ROOT"
 
+# Where to create the environment; callers may point this outside the project
+VENV_DIR="${BENCH_VENV_DIR:-.venv_piptools}"
+
+# The old environment is deleted below, so only accept a path inside the
+# project or the temporary directory that does not contain the project
+VENV_PATH=$(mkdir -p "$(dirname "$VENV_DIR")" && cd "$(dirname "$VENV_DIR")" && pwd -P)/$(basename "$VENV_DIR")
+TMP_ROOT=$(cd "${TMPDIR:-/tmp}" && pwd -P)
+case "$(basename "$VENV_DIR")" in
+    .|..|/) VENV_PATH="/" ;;
+esac
+case "$VENV_PATH" in
+    "$(pwd -P)"/*|"$TMP_ROOT"/*) ;;
+    *) VENV_PATH="/" ;;
+esac
+case "$(pwd -P)/" in
+    "$VENV_PATH"/*) VENV_PATH="/" ;;
+esac
+if [ "$VENV_PATH" = "/" ]; then
+    echo "Error: refusing to replace $VENV_DIR: it must be inside $(pwd -P) or $TMP_ROOT and must not contain the project"
+    exit 1
+fi
+
 echo "Cleaning old environment..."
-rm -rf .venv_piptools
+rm -rf "$VENV_DIR"
 
 # Create virtual environment
-python3 -m venv .venv_piptools
-source .venv_piptools/bin/activate
+python3 -m venv "$VENV_DIR"
+source "$VENV_DIR/bin/activate"
 
 # Ensure pip is up-to-date and pip-tools is installed
 pip install --upgrade pip
@@ -5,11 +5,33 @@ SCRIPT_DIR=$(dirname "$(realpath "$0")")
 PROJECT_ROOT=$(dirname "$SCRIPT_DIR")
 cd "$PROJECT_ROOT"
 
+# Where to create the environment; callers may point this outside the project
+VENV_DIR="${BENCH_VENV_DIR:-.venv_uv}"
+
+# The old environment is deleted below, so only accept a path inside the
+# project or the temporary directory that does not contain the project
+VENV_PATH=$(mkdir -p "$(dirname "$VENV_DIR")" && cd "$(dirname "$VENV_DIR")" && pwd -P)/$(basename "$VENV_DIR")
+TMP_ROOT=$(cd "${TMPDIR:-/tmp}" && pwd -P)
+case "$(basename "$VENV_DIR")" in
+    .|..|/) VENV_PATH="/" ;;
+esac
+case "$VENV_PATH" in
+    "$(pwd -P)"/*|"$TMP_ROOT"/*) ;;
+    *) VENV_PATH="/" ;;
+esac
+case "$(pwd -P)/" in
+    "$VENV_PATH"/*) VENV_PATH="/" ;;
+esac
+if [ "$VENV_PATH" = "/" ]; then
+    echo "Error: refusing to replace $VENV_DIR: it must be inside $(pwd -P) or $TMP_ROOT and must not contain the project"
+    exit 1
+fi
+
 echo "Cleaning old environment..."
-rm -rf .venv_uv
-uv venv .venv_uv
+rm -rf "$VENV_DIR"
+uv venv "$VENV_DIR"
 
-source .venv_uv/bin/activate
+source "$VENV_DIR/bin/activate"
 
 # Manually install pip if missing
 if ! command -v pip &> /dev/null; then
@@ -3,75 +3,22 @@ Benchmark tests for evaluating Python dependency management tools.
 This script measures the performance of common operations.
 """
 
+import importlib
 import os
-import subprocess
-import time
 import pytest
-import json
-import platform
+import shutil
 import sys
 from pathlib import Path
 
-
-def get_system_info():
-    """Gather system information for benchmarking context."""
-    return {
-        "platform": platform.system(),
-        "platform_release": platform.release(),
-        "platform_version": platform.version(),
-        "architecture": platform.machine(),
-        "processor": platform.processor(),
-        "python_version": platform.python_version(),
-        "cpus": os.cpu_count(),
-    }
-
-
-def run_command(command, cwd=None):
-    """Run a shell command and return the output."""
-    start_time = time.time()
-    try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-            timeout=300,  # 5-minute timeout
-        )
-        end_time = time.time()
-        
-        return {
-            "command": command,
-            "returncode": result.returncode,
-            "stdout": result.stdout,
-            "stderr": result.stderr,
-            "execution_time": end_time - start_time,
-        }
-    except subprocess.TimeoutExpired:
-        end_time = time.time()
-        print(f"Command timed out after 300 seconds: {command}")
-        return {
-            "command": command,
-            "returncode": -1,
-            "stdout": "",
-            "stderr": "Command timed out after 300 seconds",
-            "execution_time": end_time - start_time,
-        }
+from benchmark_utils import get_system_info, json_bytes, run_command
 
 
 def test_import_dependencies(benchmark):
     """Test importing common dependencies for performance."""
-    code = """
-import pandas
-import numpy
-import requests
-import flask
-import sklearn
-import black
-    """
+    modules = ["pandas", "numpy", "requests", "flask", "sklearn", "black"]
     
     def import_deps():
-        exec(code)
+        return [importlib.import_module(name) for name in modules]
     
     # Run the benchmark
     result = benchmark(import_deps)
@@ -80,6 +27,52 @@ import black
     assert result is not None
 
 
+# Tools whose install script writes nothing but the venv, which
+# BENCH_VENV_DIR can place under the scratch directory; they run straight from
+# the source tree. install_uv.sh only generates requirements.txt when it is
+# missing, so it runs in place only when that file exists. pip-tools
+# (rewrites requirements.txt), make (writes Makefile.benchmark) and poetry
+# (in-project .venv and poetry.lock) still need a staged copy.
+IN_PLACE_TOOLS = {"uv"}
+
+
+def _run_tool(tool, base):
+    """Run one tool's install script with its environment under base, staging a copy of the project if needed."""
+    if tool in IN_PLACE_TOOLS and os.path.exists("requirements.txt"):
+        env = {**os.environ, "BENCH_VENV_DIR": str((base / tool / f".venv_{tool}").resolve())}
+        print(f"Testing {tool} installation...")
+        return run_command([f"./scripts/install_{tool}.sh"], env=env)
+    
+    # Create a clean directory for each test
+    test_dir = base / tool
+    if not test_dir.exists():
+        test_dir.mkdir(parents=True)
+    
+    # Copy necessary files
+    for file in ["pyproject.toml", "requirements.in", "requirements.txt", "Makefile"]:
+        if os.path.exists(file):
+            shutil.copy(file, test_dir)
+        else:
+            print(f"Warning: File {file} does not exist, creating empty file")
+            with open(os.path.join(test_dir, file), 'w') as f:
+                if file == "requirements.txt":
+                    f.write("# Core dependencies\npandas\nnumpy\nrequests\nflask\nscikit-learn\nblack\n\n# Testing\npytest\npytest-benchmark\n")
+                elif file == "requirements.in":
+                    f.write("# Core dependencies\npandas\nnumpy\nrequests\nflask\nscikit-learn\nblack\n\n# Testing\npytest\npytest-benchmark\n")
+                elif file == "README.md":
+                    f.write("# Python Dependency Benchmark\nTesting dependency management tools\n")
+                elif file == "pyproject.toml":
+                    f.write('[build-system]\nrequires = ["poetry-core>=1.0.0"]\nbuild-backend = "poetry.core.masonry.api"\n\n[tool.poetry]\nname = "py-dependency-benchmark"\nversion = "0.1.0"\ndescription = "Benchmark for Python dependency management tools"\nauthors = ["Your Name <your.email@example.com>"]\nreadme = "README.md"\n\n[tool.poetry.dependencies]\npython = "^3.10"\npandas = "*"\nnumpy = "*"\nrequests = "*"\nflask = "*"\nscikit-learn = "*"\nblack = "*"\npytest = "*"\npytest-benchmark = "*"\n')
+    (test_dir / "scripts").mkdir(parents=True, exist_ok=True)
+    dest_script_path = test_dir / "scripts" / f"install_{tool}.sh"
+    shutil.copy(f"scripts/install_{tool}.sh", dest_script_path)
+    os.chmod(dest_script_path, 0o755)  # Make executable
+    
+    # Run the installation
+    print(f"Testing {tool} installation...")
+    return run_command([f"./scripts/install_{tool}.sh"], cwd=test_dir)
+
+
 def test_installation_speed(tmp_path):
     """
     Test the installation speed of each tool.
@@ -93,34 +86,10 @@ def test_installation_speed(tmp_path):
     if not benchmark_dir.exists():
         benchmark_dir.mkdir(parents=True)
     
+    # Install one tool at a time: execution_time is the metric being compared,
+    # and concurrent installs would contend for CPU, network and disk
     for tool in tools:
-        # Create a clean directory for each test
-        test_dir = benchmark_dir / tool
-        if not test_dir.exists():
-            test_dir.mkdir(parents=True)
-        
-        # Copy necessary files
-        for file in ["pyproject.toml", "requirements.in", "requirements.txt", "Makefile"]:
-            if os.path.exists(file):
-                subprocess.run(f"cp {file} {test_dir}", shell=True)
-            else:
-                print(f"Warning: File {file} does not exist, creating empty file")
-                with open(os.path.join(test_dir, file), 'w') as f:
-                    if file == "requirements.txt":
-                        f.write("# Core dependencies\npandas\nnumpy\nrequests\nflask\nscikit-learn\nblack\n\n# Testing\npytest\npytest-benchmark\n")
-                    elif file == "requirements.in":
-                        f.write("# Core dependencies\npandas\nnumpy\nrequests\nflask\nscikit-learn\nblack\n\n# Testing\npytest\npytest-benchmark\n")
-                    elif file == "README.md":
-                        f.write("# Python Dependency Benchmark\nTesting dependency management tools\n")
-                    elif file == "pyproject.toml":
-                        f.write('[build-system]\nrequires = ["poetry-core>=1.0.0"]\nbuild-backend = "poetry.core.masonry.api"\n\n[tool.poetry]\nname = "py-dependency-benchmark"\nversion = "0.1.0"\ndescription = "Benchmark for Python dependency management tools"\nauthors = ["Your Name <your.email@example.com>"]\nreadme = "README.md"\n\n[tool.poetry.dependencies]\npython = "^3.10"\npandas = "*"\nnumpy = "*"\nrequests = "*"\nflask = "*"\nscikit-learn = "*"\nblack = "*"\npytest = "*"\npytest-benchmark = "*"\n')
-        subprocess.run(f"mkdir -p {test_dir}/scripts", shell=True)
-        subprocess.run(f"cp scripts/install_{tool}.sh {test_dir}/scripts/", shell=True)
-        subprocess.run(f"chmod +x {test_dir}/scripts/install_{tool}.sh", shell=True)
-        
-        # Run the installation
-        print(f"Testing {tool} installation...")
-        result = run_command(f"./scripts/install_{tool}.sh", cwd=test_dir)
+        result = _run_tool(tool, benchmark_dir)
         results[tool] = result
         
         print(f"{tool} completed in {result['execution_time']:.2f}s")
@@ -134,12 +103,11 @@ def test_installation_speed(tmp_path):
                 sys.exit(1)
     
     # Save results to a JSON file
-    with open("installation_benchmark_results.json", "w") as f:
-        json.dump({
-            "system_info": get_system_info(),
-            "results": {k: {**v, "stdout": v["stdout"][:500] + "..." if len(v["stdout"]) > 500 else v["stdout"]} 
-                      for k, v in results.items()}
-        }, f, indent=2)
+    Path("installation_benchmark_results.json").write_bytes(json_bytes({
+        "system_info": get_system_info(),
+        "results": {k: {**v, "stdout": v["stdout"][:500] + "..." if len(v["stdout"]) > 500 else v["stdout"]} 
+                  for k, v in results.items()}
+    }))
     
     # Print summary
     print("\nInstallation Speed Summary:")
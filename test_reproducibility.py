@@ -7,85 +7,107 @@ import os
 import subprocess
 import tempfile
 import shutil
-import json
 import hashlib
-import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+from benchmark_utils import extract_hash_from_output, json_bytes, run_command
+
 TOOLS = ["make", "poetry", "piptools", "uv"]
 RESULTS_DIR = Path("benchmark_results")
 RAW_DIR = RESULTS_DIR / "raw"
 RAW_DIR.mkdir(parents=True, exist_ok=True)
+# Interpreter location inside a virtual environment
+VENV_PYTHON = Path("Scripts", "python.exe") if sys.platform == "win32" else Path("bin", "python")
 
 
-def run_command(command, cwd=None):
-    """Run a shell command and return the output."""
-    try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-            timeout=180,  # 3-minute timeout
-        )
-        return {
-            "command": command,
-            "returncode": result.returncode,
-            "stdout": result.stdout,
-            "stderr": result.stderr,
-        }
-    except subprocess.TimeoutExpired:
-        print(f"Command timed out after 180 seconds: {command}")
-        return {
-            "command": command,
-            "returncode": -1,
-            "stdout": "",
-            "stderr": "Command timed out after 180 seconds",
-        }
-
-
-def extract_hash_from_output(stdout_text):
-    """Extract an MD5 hash from command output."""
-    # Look for a line with "Environment hash:" or "🔐 Environment hash:" followed by a hash
-    hash_pattern = re.search(r'(?:🔐 )?Environment hash:[\r\n\s]*([a-f0-9]{32})', stdout_text)
-    if hash_pattern:
-        return hash_pattern.group(1)
-    
-    # If not found, look for any MD5 hash in the output (32 hexadecimal characters)
-    hash_pattern = re.search(r'\b([a-f0-9]{32})\b', stdout_text)
-    if hash_pattern:
-        return hash_pattern.group(1)
+def get_env_hash_from_venv(venv_dir):
+    """Get a hash of the installed packages in the virtual environment."""
+    # Account for different venv naming schemes: the directory itself, or a
+    # .venv_<project> sibling named after the containing directory
+    venv_dir = Path(venv_dir)
+    candidates = [venv_dir, venv_dir.with_name(f".venv_{venv_dir.parent.name}")]
+    python_path = next((path / VENV_PYTHON for path in candidates if (path / VENV_PYTHON).is_file()), None)
+    if python_path is None:
+        return None
+    
+    # Read the freeze output as raw bytes; it is only hashed, never decoded
+    result = subprocess.run(
+        [python_path, "-m", "pip", "freeze"],
+        capture_output=True,
+    )
+    
+    if result.returncode == 0 and result.stdout.strip():
+        # Sort and hash exactly as the install scripts' `pip freeze | sort | md5sum`
+        # does, so a fallback hash compares equal to a printed one; sort(1)
+        # follows the locale, which a bytewise sort in Python would not
+        if sys.platform == "win32":
+            # "sort" is the unrelated Windows sort.exe here, so sort bytewise;
+            # such hashes are only comparable with each other, not with the
+            # hashes the scripts print under a POSIX shell
+            lines = sorted(result.stdout.splitlines())
+            return hashlib.md5(b"".join(line + b"\n" for line in lines)).hexdigest()
+        sorted_freeze = subprocess.run(["sort"], input=result.stdout, capture_output=True)
+        if sorted_freeze.returncode == 0:
+            return hashlib.md5(sorted_freeze.stdout).hexdigest()
     
     return None
 
 
-def get_env_hash_from_venv(venv_dir):
-    """Get a hash of the installed packages in the virtual environment."""
-    # Account for different venv naming schemes
-    venv_paths = [
-        venv_dir,
-        venv_dir.replace(".venv", f".venv_{os.path.basename(os.path.dirname(venv_dir))}"),
-        os.path.join(os.path.dirname(venv_dir), f".venv_{os.path.basename(os.path.dirname(venv_dir))}")
-    ]
-    
-    for path in venv_paths:
-        if os.path.exists(path):
-            python_path = os.path.join(path, "bin", "python")
-            if os.path.exists(python_path):
-                result = subprocess.run(
-                    f"{python_path} -m pip freeze | sort",
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                )
-                
-                if result.returncode == 0 and result.stdout.strip():
-                    # Create a hash of the sorted package list
-                    return hashlib.md5(result.stdout.encode()).hexdigest()
+def _stage_tool(tool, tmp_dir, script_path):
+    """Copy the project files and install script for tool into tmp_dir; return False if the script is missing."""
+    # Copy necessary files
+    for file in ["pyproject.toml", "requirements.in", "requirements.txt", "Makefile", "README.md"]:
+        if os.path.exists(file):
+            shutil.copy(file, tmp_dir)
+        else:
+            # Create the file if it doesn't exist
+            with open(os.path.join(tmp_dir, file), 'w') as f:
+                if file == "requirements.txt":
+                    f.write("# Core dependencies\npandas\nnumpy\nrequests\nflask\nscikit-learn\nblack\n\n# Testing\npytest\npytest-benchmark\n")
+                elif file == "requirements.in":
+                    f.write("# Core dependencies\npandas\nnumpy\nrequests\nflask\nscikit-learn\nblack\n\n# Testing\npytest\npytest-benchmark\n")
+                elif file == "README.md":
+                    f.write("# Python Dependency Benchmark\nTesting dependency management tools\n")
+                elif file == "pyproject.toml":
+                    f.write('[build-system]\nrequires = ["poetry-core>=1.0.0"]\nbuild-backend = "poetry.core.masonry.api"\n\n[tool.poetry]\nname = "py-dependency-benchmark"\nversion = "0.1.0"\ndescription = "Benchmark for Python dependency management tools"\nauthors = ["Your Name <your.email@example.com>"]\nreadme = "README.md"\n\n[tool.poetry.dependencies]\npython = "^3.10"\npandas = "*"\nnumpy = "*"\nrequests = "*"\nflask = "*"\nscikit-learn = "*"\nblack = "*"\npytest = "*"\npytest-benchmark = "*"\n')
+    
+    # Create scripts directory
+    os.makedirs(os.path.join(tmp_dir, "scripts"), exist_ok=True)
+    dest_script_path = os.path.join(tmp_dir, "scripts", f"install_{tool}.sh")
+    if not os.path.exists(script_path):
+        print(f"[{tool}] Error: Cannot find {script_path}")
+        return False
+    shutil.copy(script_path, dest_script_path)
+    os.chmod(dest_script_path, 0o755)  # Make executable
+    return True
+
+
+def _run_iteration(tool, i, iterations, tmp_dir):
+    """Install one environment for tool in the staged tmp_dir; return (result, env_hash)."""
+    print(f"[{tool}] Iteration {i+1}/{iterations}...")
     
-    return None
+    # Run installation
+    result = run_command([f"./scripts/install_{tool}.sh"], cwd=tmp_dir, timeout=180)  # 3-minute timeout
+    
+    # PRIMARY CHANGE: First try to extract hash from command output
+    env_hash = extract_hash_from_output(result["stdout"])
+    
+    # If not found in output, fall back to calculating it from the venv
+    if not env_hash:
+        # Try both standard .venv and tool-specific .venv_tool paths
+        tool_specific_venv = os.path.join(tmp_dir, f".venv_{tool}")
+        standard_venv = os.path.join(tmp_dir, ".venv")
+        
+        if os.path.exists(tool_specific_venv):
+            env_hash = get_env_hash_from_venv(tool_specific_venv)
+        elif os.path.exists(standard_venv):
+            env_hash = get_env_hash_from_venv(standard_venv)
+    
+    print(f"[{tool}] Environment hash: {env_hash}")
+    return result, env_hash
 
 
 def test_tool_reproducibility(tool, iterations=3):
@@ -96,78 +118,47 @@ def test_tool_reproducibility(tool, iterations=3):
     results = []
     hashes = []
     
-    print(f"\n=== Testing reproducibility of {tool} ===")
+    print(f"[{tool}] === Testing reproducibility ===")
     
     # Ensure directories exist
     for file in ["pyproject.toml", "requirements.in", "Makefile"]:
         if not os.path.exists(file):
-            print(f"Warning: {file} does not exist")
+            print(f"[{tool}] Warning: {file} does not exist")
     
     if not os.path.exists("scripts"):
-        print("Warning: scripts directory does not exist")
+        print(f"[{tool}] Warning: scripts directory does not exist")
         os.makedirs("scripts", exist_ok=True)
     
     script_path = f"scripts/install_{tool}.sh"
     if not os.path.exists(script_path):
-        print(f"Warning: {script_path} does not exist")
-    
-    # Create multiple environments
-    for i in range(iterations):
-        print(f"  Iteration {i+1}/{iterations}...")
-        
-        # Create a temporary directory
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            # Copy necessary files
-            for file in ["pyproject.toml", "requirements.in", "requirements.txt", "Makefile", "README.md"]:
-                if os.path.exists(file):
-                    shutil.copy(file, tmp_dir)
-                else:
-                    # Create the file if it doesn't exist
-                    with open(os.path.join(tmp_dir, file), 'w') as f:
-                        if file == "requirements.txt":
-                            f.write("# Core dependencies\npandas\nnumpy\nrequests\nflask\nscikit-learn\nblack\n\n# Testing\npytest\npytest-benchmark\n")
-                        elif file == "requirements.in":
-                            f.write("# Core dependencies\npandas\nnumpy\nrequests\nflask\nscikit-learn\nblack\n\n# Testing\npytest\npytest-benchmark\n")
-                        elif file == "README.md":
-                            f.write("# Python Dependency Benchmark\nTesting dependency management tools\n")
-                        elif file == "pyproject.toml":
-                            f.write('[build-system]\nrequires = ["poetry-core>=1.0.0"]\nbuild-backend = "poetry.core.masonry.api"\n\n[tool.poetry]\nname = "py-dependency-benchmark"\nversion = "0.1.0"\ndescription = "Benchmark for Python dependency management tools"\nauthors = ["Your Name <your.email@example.com>"]\nreadme = "README.md"\n\n[tool.poetry.dependencies]\npython = "^3.10"\npandas = "*"\nnumpy = "*"\nrequests = "*"\nflask = "*"\nscikit-learn = "*"\nblack = "*"\npytest = "*"\npytest-benchmark = "*"\n')
-            
-            # Create scripts directory
-            os.makedirs(os.path.join(tmp_dir, "scripts"), exist_ok=True)
-            dest_script_path = os.path.join(tmp_dir, "scripts", f"install_{tool}.sh")
-            if os.path.exists(script_path):
-                shutil.copy(script_path, dest_script_path)
-                os.chmod(dest_script_path, 0o755)  # Make executable
-            else:
-                print(f"  Error: Cannot find {script_path}")
-                continue
-            
-            # Run installation
-            result = run_command(f"./scripts/install_{tool}.sh", cwd=tmp_dir)
-            results.append(result)
-            
-            # PRIMARY CHANGE: First try to extract hash from command output
-            env_hash = extract_hash_from_output(result["stdout"])
-            
-            # If not found in output, fall back to calculating it from the venv
-            if not env_hash:
-                # Try both standard .venv and tool-specific .venv_tool paths
-                tool_specific_venv = os.path.join(tmp_dir, f".venv_{tool}")
-                standard_venv = os.path.join(tmp_dir, ".venv")
+        print(f"[{tool}] Warning: {script_path} does not exist")
+    
+    # Create multiple environments in one staging directory per tool
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if _stage_tool(tool, tmp_dir, script_path):
+            staged = set(os.listdir(tmp_dir))
+            for i in range(iterations):
+                if i:
+                    # Remove whatever the previous install created (venvs, lockfiles)
+                    # and copy the inputs again, since pip-compile rewrites
+                    # requirements.txt in place, so every iteration starts from
+                    # the original inputs alone
+                    for name in set(os.listdir(tmp_dir)) - staged:
+                        path = os.path.join(tmp_dir, name)
+                        if os.path.isdir(path) and not os.path.islink(path):
+                            shutil.rmtree(path)
+                        else:
+                            os.remove(path)
+                    _stage_tool(tool, tmp_dir, script_path)
                 
-                if os.path.exists(tool_specific_venv):
-                    env_hash = get_env_hash_from_venv(tool_specific_venv)
-                elif os.path.exists(standard_venv):
-                    env_hash = get_env_hash_from_venv(standard_venv)
-            
-            hashes.append(env_hash)
-            print(f"    Environment hash: {env_hash}")
+                result, env_hash = _run_iteration(tool, i, iterations, tmp_dir)
+                results.append(result)
+                hashes.append(env_hash)
     
     # Check if all hashes are the same and none are None
     is_reproducible = len(set(hashes)) == 1 and None not in hashes
     
-    print(f"  Reproducible: {is_reproducible}")
+    print(f"[{tool}] Reproducible: {is_reproducible}")
     
     return {
         "tool": tool,
@@ -187,18 +178,24 @@ def main():
     results = {}
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     
-    # Test reproducibility of each tool
-    for tool in TOOLS:
-        results[tool] = test_tool_reproducibility(tool)
+    # Test reproducibility of each tool. Tools stage into separate
+    # directories, so run them concurrently
+    with ThreadPoolExecutor(max_workers=len(TOOLS)) as executor:
+        results = dict(zip(TOOLS, executor.map(test_tool_reproducibility, TOOLS)))
     
     # Save results to a JSON file with timestamp
     results_file = RAW_DIR / f"reproducibility_results_{timestamp}.json"
-    with open(results_file, "w") as f:
-        json.dump(results, f, indent=2)
+    payload = json_bytes(results)
+    results_file.write_bytes(payload)
     
-    # Also save to the standard location for backward compatibility
-    with open("reproducibility_results.json", "w") as f:
-        json.dump(results, f, indent=2)
+    # Also save to the standard location for backward compatibility, as a
+    # hardlink to the timestamped file when the filesystem allows it
+    compat_file = Path("reproducibility_results.json")
+    compat_file.unlink(missing_ok=True)
+    try:
+        os.link(results_file, compat_file)
+    except OSError:
+        compat_file.write_bytes(payload)
     
     # Print summary
     print("\n=== Reproducibility Summary ===")